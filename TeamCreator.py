@@ -1,4 +1,5 @@
 import os
+import io
 import csv
 import re
 import random
@@ -6,8 +7,17 @@ import tkinter as tk
 import sys
 import traceback
 import datetime
+import bisect
+import collections
+import concurrent.futures
+import functools
+import json
+import logging
+import operator
 from tkinter import filedialog, simpledialog, messagebox, Checkbutton, IntVar
 
+log = logging.getLogger(__name__)
+
 
 def detect_file_encoding(file_path):
     """
@@ -42,7 +52,133 @@ def detect_file_encoding(file_path):
         return 'utf-8'  # Default fallback
 
 
+def file_needs_newline(file_path, file_encoding):
+    """
+    Check if a non-empty file is missing its trailing newline.
+    Only the last encoded character is read, so this is cheap on large files.
+    """
+    newline = '\n'.encode(file_encoding)
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return False
+        if size < len(newline):
+            return True
+        f.seek(-len(newline), os.SEEK_END)
+        return f.read() != newline
+
+
+def read_text_file(file_path, file_encoding):
+    """
+    Read a whole text file in one go.
+    The raw bytes are decoded in a single call instead of going through the incremental text-mode
+    decoder; newlines are normalized to '\n' the same way text mode would.
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read().decode(file_encoding)
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# Whole-number input, optionally signed and padded with whitespace
+_INT_RE = re.compile(r'^\s*[+-]?\d+\s*$')
+
+
+def parse_int(text):
+    """
+    Parse a user-entered whole number without raising on bad input
+
+    Returns:
+        int or None: The number, or None if the text is empty or not a whole number
+    """
+    return int(text) if text and _INT_RE.match(text) else None
+
+
+def _file_mtime_ns(file_path):
+    """Modification time of a file in nanoseconds, or None if it can't be read"""
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Highest ID per (file_path, column_idx) as (mtime_ns, highest_id); an entry is only used while the
+# file's mtime still matches, so edits made between teams or by another tool force a rescan
+_highest_id_cache = {}
+
+
+def read_file_header(file_path, file_type):
+    """
+    Read the header line of a game file and map column names to their indices.
+    The result is cached until the file changes on disk.
+
+    Args:
+        file_path (str): Path to the file
+        file_type (str): Type of file being parsed (for reference)
+
+    Returns:
+        dict: Dictionary mapping column names to their indices
+    """
+    return _read_file_header(file_path, file_type, _file_mtime_ns(file_path))
+
+
+@functools.lru_cache(maxsize=64)
+def _read_file_header(file_path, file_type, mtime_ns):
+    """Read and index a header line (mtime_ns only keys the cache)"""
+    try:
+        # Auto-detect encoding
+        file_encoding = detect_file_encoding(file_path)
+        with open(file_path, 'r', encoding=file_encoding) as file:
+            header_line = file.readline().strip()
+
+        if not header_line:
+            log.warning("%s file has no header line", file_type)
+            return {}
+
+        header_columns = header_line.split('\t')
+        header_dict = {col: idx for idx, col in enumerate(header_columns)}
+
+        log.debug("Parsed header for %s: Found %s columns", file_type, len(header_dict))
+        return header_dict
+    except Exception as e:
+        log.error("Error parsing header for %s file: %s", file_type, e)
+        return {}
+
+
+def clear_file_caches():
+    """Forget cached headers and highest IDs so the next run rescans the game files"""
+    _read_file_header.cache_clear()
+    _highest_id_cache.clear()
+
+
 class TeamAppender:
+    # Define standard positions for sorting and selection
+    position_order = {
+        'GK': 0,  # Goalkeeper
+        'CB': 1,  # Central Defender
+        'RB': 2,  # Right Back
+        'LB': 3,  # Left Back
+        'CDM': 4,  # Defensive Midfielder
+        'CM': 5,  # Central Midfielder
+        'CAM': 6,  # Attacking Midfielder
+        'RM': 7,  # Right Midfielder/Winger
+        'LM': 8,  # Left Midfielder/Winger
+        'ST': 9,  # Striker
+        'CF': 10  # Center Forward
+    }
+
+    # Formation positions (4-3-3 with GK)
+    formation_positions = (
+        'GK',  # Goalkeeper
+        'CB', 'CB',  # Center Backs
+        'LB', 'RB',  # Full Backs
+        'CDM',  # Defensive Midfielder
+        'CM', 'CM',  # Central Midfielders
+        'LM', 'RM',  # Wingers
+        'ST'  # Striker
+    )
+
     def __init__(self, team_name, team_id, league_id, nation_id=None, is_national_team=False, stadium_id=None):
         """
         Initialize TeamAppender with the new team information
@@ -55,6 +191,15 @@ class TeamAppender:
             is_national_team (bool): Whether this is a national team
             stadium_id (int, optional): The stadium ID to link to the team
         """
+        self.reset(team_name, team_id, league_id, nation_id, is_national_team, stadium_id)
+
+    def reset(self, team_name, team_id, league_id, nation_id=None, is_national_team=False, stadium_id=None):
+        """
+        Point this appender at a new team and forget the previous team's players,
+        so one appender can be reused across an interactive session
+
+        Args: same as __init__
+        """
         self.team_name = team_name
         self.team_id = team_id
         self.league_id = league_id
@@ -70,31 +215,9 @@ class TeamAppender:
         # Dictionary to store file headers and column positions
         self.file_headers = {}
 
-        # Define standard positions for sorting and selection
-        self.position_order = {
-            'GK': 0,  # Goalkeeper
-            'CB': 1,  # Central Defender
-            'RB': 2,  # Right Back
-            'LB': 3,  # Left Back
-            'CDM': 4,  # Defensive Midfielder
-            'CM': 5,  # Central Midfielder
-            'CAM': 6,  # Attacking Midfielder
-            'RM': 7,  # Right Midfielder/Winger
-            'LM': 8,  # Left Midfielder/Winger
-            'ST': 9,  # Striker
-            'CF': 10  # Center Forward
-        }
-
-        # Formation positions (4-3-3 with GK)
-        self.formation_positions = [
-            'GK',  # Goalkeeper
-            'CB', 'CB',  # Center Backs
-            'LB', 'RB',  # Full Backs
-            'CDM',  # Defensive Midfielder
-            'CM', 'CM',  # Central Midfielders
-            'LM', 'RM',  # Wingers
-            'ST'  # Striker
-        ]
+        # Squad details that the file writers only use if the current team set them
+        self.game_position_ids = None
+        self.limited_squad = None
 
     def load_player_data(self, player_file_path):
         """
@@ -103,7 +226,7 @@ class TeamAppender:
         Args:
             player_file_path (str): Path to the player CSV/TXT file
         """
-        print(f"Loading player data from: {player_file_path}")
+        log.debug("Loading player data from: %s", player_file_path)
 
         # Handle national team player loading from players.txt
         if self.is_national_team:
@@ -111,7 +234,8 @@ class TeamAppender:
 
         # Regular club team player loading
         try:
-            with open(player_file_path, 'r', encoding='utf-8') as file:
+            # newline='' lets the csv module handle line endings; the large buffer cuts read() calls on big rosters
+            with open(player_file_path, 'r', encoding='utf-8', newline='', buffering=128 * 1024) as file:
                 # Use tab as the delimiter
                 reader = csv.DictReader(file, delimiter='\t')
                 for row in reader:
@@ -136,11 +260,11 @@ class TeamAppender:
                         else:
                             self.players.append(row)
                     except (ValueError, KeyError) as e:
-                        print(
-                            f"Warning: Skipped player with invalid data: {row.get('given', 'Unknown')} {row.get('sur', 'Unknown')} - {str(e)}")
+                        log.warning("Skipped player with invalid data: %s %s - %s",
+                                    row.get('given', 'Unknown'), row.get('sur', 'Unknown'), e)
 
             if not self.players:
-                print("Error: No valid field players found in the file.")
+                log.error("No valid field players found in the file.")
                 return False
 
             # Create a balanced squad based on positions
@@ -149,12 +273,12 @@ class TeamAppender:
             # Initialize the consistent player IDs list after creating the squad
             self.player_ids = self.get_starting_player_ids()
 
-            print(
-                f"Loaded {len(self.players)} field players and {len(self.goalkeepers)} goalkeepers. Captain ID: {self.captain_id}")
+            log.debug("Loaded %s field players and %s goalkeepers. Captain ID: %s",
+                      len(self.players), len(self.goalkeepers), self.captain_id)
             return True
 
         except Exception as e:
-            print(f"Error loading player file: {e}")
+            log.error("Error loading player file: %s", e)
             return False
 
     def load_national_team_players(self, players_file_path):
@@ -163,99 +287,95 @@ class TeamAppender:
         Filters by nationality, gender, and positions
         Excludes blacklisted players
 
+        The file is parsed once into a per-nation table (cached until it changes on
+        disk), so a batch of national teams doesn't re-read it for every nation.
+
         Args:
             players_file_path (str): Path to the players.txt file
         """
-        print(f"Loading players for nation ID {self.nation_id} from: {players_file_path}")
-
-        # Load blacklisted player IDs
-        blacklisted_players = load_blacklisted_players()
+        log.debug("Loading players for nation ID %s from: %s", self.nation_id, players_file_path)
 
         try:
-            with open(players_file_path, 'r', encoding='utf-16-le') as file:
-                # Read header line to determine column indices
-                header_line = file.readline().strip()
-                headers = header_line.split('\t')
+            players_by_nation = _load_players_table(players_file_path, os.path.getmtime(players_file_path))
+        except Exception as e:
+            log.error("Error loading national team players: %s", e)
+            traceback.print_exc()
+            return False
 
-                # Create mapping of column names to indices
-                column_indices = {col.lower(): idx for idx, col in enumerate(headers)}
+        if players_by_nation is None:
+            log.error("players.txt header is missing a required column.")
+            return False
 
-                # Check for required columns
-                required_columns = ['playerid', 'nationality', 'gender', 'preferredposition1', 'overallrating']
-                for col in required_columns:
-                    if col not in column_indices:
-                        print(f"Error: Required column '{col}' not found in players.txt header.")
-                        return False
+        return self.load_player_data_from_rows(
+            eligible_players(players_by_nation.get(self.nation_id, []), load_blacklisted_players()))
 
-                # Process player rows
-                for line in file:
-                    fields = line.strip().split('\t')
+    def load_player_data_from_rows(self, rows):
+        """
+        Load national team players that were already read from players.txt
 
-                    # Skip rows that don't have enough fields
-                    if len(fields) <= max(column_indices.values()):
-                        continue
+        Args:
+            rows (list): This nation's (player_id, position, ovr, name) tuples from load_players_grouped_by_nation()
+        """
+        log.debug("Loading %s preloaded players for nation ID %s", len(rows), self.nation_id)
 
-                    try:
-                        # Extract key fields
-                        player_id = int(fields[column_indices['playerid']])
+        try:
+            for player_id, position, overall, _ in rows:
+                self.add_national_player(player_id, str(position), overall)
+            return self.build_national_squad()
 
-                        # Skip blacklisted players
-                        if player_id in blacklisted_players:
-                            continue
+        except Exception as e:
+            log.error("Error loading national team players: %s", e)
+            traceback.print_exc()
+            return False
 
-                        nationality = int(fields[column_indices['nationality']])
-                        gender = int(fields[column_indices['gender']])
-                        position1 = fields[column_indices['preferredposition1']]
-                        overall = int(fields[column_indices['overallrating']])
-
-                        # Match nationality and gender
-                        if nationality == self.nation_id and gender == 0:
-                            # Create a dict with player data
-                            player_data = {
-                                'playerid': player_id,
-                                'ovr': overall,
-                                'pos1': self.map_game_position_to_standard(position1),
-                                'given': 'Player',  # We don't have names, so using placeholders
-                                'sur': str(player_id)
-                            }
-
-                            # Add position order for sorting
-                            player_data['pos_order'] = self.position_order.get(player_data['pos1'], 999)
-
-                            # Store all positions for this player (just the primary one in this case)
-                            player_data['positions'] = [player_data['pos1']]
-
-                            # Separate goalkeepers from field players
-                            if player_data['pos1'] == 'GK':
-                                self.goalkeepers.append(player_data)
-                            else:
-                                self.players.append(player_data)
+    def build_national_squad(self):
+        """Pick the national team squad from the loaded players"""
+        # Check if we found enough players
+        if not self.players:
+            log.error("No valid field players found for nation ID %s", self.nation_id)
+            return False
 
-                    except (ValueError, IndexError) as e:
-                        # Silently skip invalid rows
-                        continue
+        log.debug("Found %s field players and %s goalkeepers for nation ID %s",
+                  len(self.players), len(self.goalkeepers), self.nation_id)
 
-            # Check if we found enough players
-            if not self.players:
-                print(f"Error: No valid field players found for nation ID {self.nation_id}")
-                return False
+        # Create a balanced squad based on positions
+        self.create_balanced_squad()
 
-            print(
-                f"Found {len(self.players)} field players and {len(self.goalkeepers)} goalkeepers for nation ID {self.nation_id}")
+        # Initialize the player IDs list
+        self.player_ids = self.get_starting_player_ids()
 
-            # Create a balanced squad based on positions
-            self.create_balanced_squad()
+        log.debug("Created squad with captain ID: %s", self.captain_id)
+        return True
 
-            # Initialize the player IDs list
-            self.player_ids = self.get_starting_player_ids()
+    def add_national_player(self, player_id, position1, overall):
+        """
+        Add one national team player to the goalkeeper or field player pool
 
-            print(f"Created squad with captain ID: {self.captain_id}")
-            return True
+        Args:
+            player_id (int): Player ID
+            position1 (str): Preferred position as a game position ID
+            overall (int): Overall rating
+        """
+        # Create a dict with player data
+        player_data = {
+            'playerid': player_id,
+            'ovr': overall,
+            'pos1': self.map_game_position_to_standard(position1),
+            'given': 'Player',  # We don't have names, so using placeholders
+            'sur': str(player_id)
+        }
 
-        except Exception as e:
-            print(f"Error loading national team players: {e}")
-            traceback.print_exc()
-            return False
+        # Add position order for sorting
+        player_data['pos_order'] = self.position_order.get(player_data['pos1'], 999)
+
+        # Store all positions for this player (just the primary one in this case)
+        player_data['positions'] = [player_data['pos1']]
+
+        # Separate goalkeepers from field players
+        if player_data['pos1'] == 'GK':
+            self.goalkeepers.append(player_data)
+        else:
+            self.players.append(player_data)
 
     def map_game_position_to_standard(self, game_position):
         """Map FIFA game position ID to standard position code"""
@@ -325,19 +445,19 @@ class TeamAppender:
         all_gks = sorted(self.goalkeepers, key=lambda x: x.get('ovr', 0), reverse=True)
         all_field = sorted(self.players, key=lambda x: x.get('ovr', 0), reverse=True)
 
-        print("\n=== BUILDING STARTING XI ===")
-        print(f"Available: {len(all_gks)} GKs, {len(all_field)} field players")
-        print(f"Position penalty: {POSITION_PENALTY} OVR per position tier")
+        log.debug("=== BUILDING STARTING XI ===")
+        log.debug("Available: %s GKs, %s field players", len(all_gks), len(all_field))
+        log.debug("Position penalty: %s OVR per position tier", POSITION_PENALTY)
 
         # Count players by position
         pos_counts = {}
         for p in all_field:
             pos = p.get('pos1', 'Unknown')
             pos_counts[pos] = pos_counts.get(pos, 0) + 1
-        print(f"Position breakdown: {pos_counts}")
+        log.debug("Position breakdown: %s", pos_counts)
 
         # PASS 1: Fill each slot considering both position AND overall
-        print("\nPASS 1: Assigning best players (position + overall)")
+        log.debug("PASS 1: Assigning best players (position + overall)")
         for idx, name, game_id, acceptable_positions in formation_slots:
             if self.starting_eleven[idx] is not None:
                 continue
@@ -349,7 +469,9 @@ class TeamAppender:
                     player = available[0]
                     self.starting_eleven[idx] = player
                     used_players.add(player['playerid'])
-                    print(f"  [{idx}] {name}: {player.get('given', '')} {player.get('sur', '')} ({player.get('pos1')}, OVR {player.get('ovr')})")
+                    log.debug("  [%s] %s: %s %s (%s, OVR %s)",
+                              idx, name, player.get('given', ''), player.get('sur', ''), player.get('pos1'),
+                              player.get('ovr'))
                 continue
 
             # For field positions, find the best player considering position priority AND overall
@@ -377,10 +499,12 @@ class TeamAppender:
             if best_candidate:
                 self.starting_eleven[idx] = best_candidate
                 used_players.add(best_candidate['playerid'])
-                print(f"  [{idx}] {name}: {best_candidate.get('given', '')} {best_candidate.get('sur', '')} ({best_candidate.get('pos1')}, OVR {best_candidate.get('ovr')}) [{best_info}]")
+                log.debug("  [%s] %s: %s %s (%s, OVR %s) [%s]",
+                          idx, name, best_candidate.get('given', ''), best_candidate.get('sur', ''),
+                          best_candidate.get('pos1'), best_candidate.get('ovr'), best_info)
 
         # PASS 2: Fill any remaining slots with best available players by position group
-        print("\nPASS 2: Filling remaining slots with compatible players")
+        log.debug("PASS 2: Filling remaining slots with compatible players")
         defense_pos = ["CB", "RB", "LB", "RWB", "LWB"]
         midfield_pos = ["CDM", "CM", "CAM", "RM", "LM"]
         attack_pos = ["ST", "CF", "RW", "LW"]
@@ -410,12 +534,14 @@ class TeamAppender:
                     if player.get('pos1') == search_pos:
                         self.starting_eleven[idx] = player
                         used_players.add(player['playerid'])
-                        print(f"  [{idx}] {name}: {player.get('given', '')} {player.get('sur', '')} ({player.get('pos1')}, OVR {player.get('ovr')}) [backup]")
+                        log.debug("  [%s] %s: %s %s (%s, OVR %s) [backup]",
+                                  idx, name, player.get('given', ''), player.get('sur', ''), player.get('pos1'),
+                                  player.get('ovr'))
                         assigned = True
                         break
 
         # PASS 3: Last resort - fill with any remaining player
-        print("\nPASS 3: Last resort fill")
+        log.debug("PASS 3: Last resort fill")
         for idx, name, game_id, acceptable_positions in formation_slots:
             if self.starting_eleven[idx] is not None:
                 continue
@@ -429,7 +555,9 @@ class TeamAppender:
                 player = available[0]
                 self.starting_eleven[idx] = player
                 used_players.add(player['playerid'])
-                print(f"  [{idx}] {name}: {player.get('given', '')} {player.get('sur', '')} ({player.get('pos1')}, OVR {player.get('ovr')}) [last resort]")
+                log.debug("  [%s] %s: %s %s (%s, OVR %s) [last resort]",
+                          idx, name, player.get('given', ''), player.get('sur', ''), player.get('pos1'),
+                          player.get('ovr'))
 
         # Set captain as highest-rated outfield player
         field_players = [p for p in self.starting_eleven if p and p.get('pos1') != 'GK']
@@ -440,14 +568,16 @@ class TeamAppender:
             self.captain_id = self.starting_eleven[0]['playerid'] if self.starting_eleven[0] else None
 
         # Print final squad
-        print("\n=== FINAL STARTING XI ===")
+        log.debug("=== FINAL STARTING XI ===")
         for idx, name, game_id, _ in formation_slots:
             player = self.starting_eleven[idx]
             if player:
                 is_captain = " (C)" if player['playerid'] == self.captain_id else ""
-                print(f"  {idx}. {name} (pos_id={game_id}): {player.get('given', '')} {player.get('sur', '')} - {player.get('pos1')} - OVR {player.get('ovr')}{is_captain}")
+                log.debug("  %s. %s (pos_id=%s): %s %s - %s - OVR %s%s",
+                          idx, name, game_id, player.get('given', ''), player.get('sur', ''), player.get('pos1'),
+                          player.get('ovr'), is_captain)
             else:
-                print(f"  {idx}. {name} (pos_id={game_id}): EMPTY!")
+                log.debug("  %s. %s (pos_id=%s): EMPTY!", idx, name, game_id)
 
         # Store game position IDs for other methods
         self.game_position_ids = [slot[2] for slot in formation_slots]
@@ -472,15 +602,15 @@ class TeamAppender:
                 # Get the next artificial key from the correct column
                 if artificial_key_idx is not None:
                     next_key = self.get_highest_id_from_file(file_path, artificial_key_idx, 26271) + 1
-                    print(f"Found artificialkey at column {artificial_key_idx}, next key: {next_key}")
+                    log.debug("Found artificialkey at column %s, next key: %s", artificial_key_idx, next_key)
                 else:
                     next_key = 26272
-                    print(f"Could not find artificialkey column, using default: {next_key}")
+                    log.warning("Could not find artificialkey column, using default: %s", next_key)
 
                 # For club teams, identify players linked to team 111592
                 players_to_remove_from_111592 = {}
                 if not self.is_national_team:
-                    print("Checking for players linked to team ID 111592...")
+                    log.debug("Checking for players linked to team ID 111592...")
                     try:
                         # Keep track of the player IDs we'll be using in our team
                         our_player_ids = set()
@@ -490,7 +620,7 @@ class TeamAppender:
                         for player in self.goalkeepers + self.players:
                             our_player_ids.add(str(player['playerid']))
 
-                        print(f"Our team will use {len(our_player_ids)} players")
+                        log.debug("Our team will use %s players", len(our_player_ids))
 
                         # Process the file to find lines where our players are linked to team 111592
                         with open(file_path, 'r', encoding=file_encoding) as file:
@@ -511,7 +641,7 @@ class TeamAppender:
                                     if team_id == "111592" and player_id in our_player_ids:
                                         lines_to_remove.append(i)
                                         players_to_remove_from_111592[player_id] = i
-                                        print(f"Will remove player ID {player_id} from team 111592")
+                                        log.debug("Will remove player ID %s from team 111592", player_id)
 
                                     # Keep the line
                                     file_content.append(line)
@@ -522,7 +652,7 @@ class TeamAppender:
 
                         # Remove the identified lines
                         if lines_to_remove:
-                            print(f"Removing {len(lines_to_remove)} links to team 111592")
+                            log.debug("Removing %s links to team 111592", len(lines_to_remove))
                             for index in sorted(lines_to_remove, reverse=True):
                                 del file_content[index]
 
@@ -530,14 +660,14 @@ class TeamAppender:
                         with open(file_path, 'w', encoding=file_encoding) as file:
                             file.writelines(file_content)
 
-                        print(f"Removed {len(players_to_remove_from_111592)} player links from team 111592")
+                        log.debug("Removed %s player links from team 111592", len(players_to_remove_from_111592))
 
                     except Exception as e:
-                        print(f"Warning: Could not scan or remove players linked to 111592: {str(e)}")
+                        log.warning("Could not scan or remove players linked to 111592: %s", e)
                         traceback.print_exc()  # Print the full error trace
 
                 # Use the exact game position IDs stored during create_balanced_squad
-                if hasattr(self, 'game_position_ids'):
+                if self.game_position_ids is not None:
                     starting_position_ids = self.game_position_ids
                 else:
                     # Fallback to the exact position IDs provided by user if method is called directly
@@ -547,7 +677,7 @@ class TeamAppender:
                 total_available_players = len(self.starting_eleven) + len([p for p in self.goalkeepers + self.players
                                                                            if p not in self.starting_eleven])
 
-                print(f"Total available players in data file: {total_available_players}")
+                log.debug("Total available players in data file: %s", total_available_players)
 
                 # Calculate how many additional players we need to add after the starting 11
                 additional_players_count = total_available_players - len(self.starting_eleven)
@@ -570,11 +700,11 @@ class TeamAppender:
                 position_ids = position_ids[:total_available_players]
 
                 # Print confirmation of position ID mapping for debugging
-                print("\nTEAMPLAYERLINKS POSITION MAPPING:")
+                log.debug("TEAMPLAYERLINKS POSITION MAPPING:")
                 for i in range(min(11, len(starting_position_ids))):
                     player = self.starting_eleven[i] if i < len(self.starting_eleven) else None
                     player_name = f"{player.get('given', '')} {player.get('sur', '')}" if player else "Unknown"
-                    print(f"Position {i}: ID {starting_position_ids[i]} - {player_name}")
+                    log.debug("Position %s: ID %s - %s", i, starting_position_ids[i], player_name)
 
                 teamplayerlinks_lines = []
 
@@ -627,7 +757,7 @@ class TeamAppender:
                 if self.is_national_team:
                     max_squad_size = 26
                     if len(all_players) > max_squad_size:
-                        print(f"Limiting national team from {len(all_players)} to {max_squad_size} players")
+                        log.debug("Limiting national team from %s to %s players", len(all_players), max_squad_size)
 
                         # Keep starting XI
                         limited_squad = all_players[:11]
@@ -668,7 +798,7 @@ class TeamAppender:
                     # Store the limited squad for use in other methods
                     self.limited_squad = all_players
 
-                print(f"Final squad size: {len(all_players)} players")
+                log.debug("Final squad size: %s players", len(all_players))
 
                 # Ensure we don't have more players than actual data
                 total_available_players = len(all_players)
@@ -685,8 +815,8 @@ class TeamAppender:
                     # Check if this player was removed from team 111592
                     player_id_str = str(player['playerid'])
                     if player_id_str in players_to_remove_from_111592:
-                        print(
-                            f"Player ID {player_id_str} was removed from team 111592 and is now exclusively in team {self.team_id}")
+                        log.debug("Player ID %s was removed from team 111592 and is now exclusively in team %s",
+                                  player_id_str, self.team_id)
 
                     teamplayerlinks_lines.append(
                         f"0\t0\t0\t0\t{jersey_number}\t{position}\t{next_key + i}\t{self.team_id}\t0\t0\t0\t0\t0\t{player['playerid']}\t0\t0")
@@ -695,8 +825,7 @@ class TeamAppender:
                 teamplayerlinks_template = '\n'.join(teamplayerlinks_lines)
 
                 # Read the existing content to keep it
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Ensure there's a newline at the end of the original content
                 if content and not content.endswith('\n'):
@@ -706,19 +835,20 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + teamplayerlinks_template)
 
-                print(f"✓ Added team player links to file: {file_path}, linked {len(teamplayerlinks_lines)} players")
+                log.debug("✓ Added team player links to file: %s, linked %s players",
+                          file_path, len(teamplayerlinks_lines))
 
                 if players_to_remove_from_111592:
-                    print(
-                        f"✓ Successfully removed {len(players_to_remove_from_111592)} players from team 111592 and added them to team {self.team_id}")
+                    log.debug("✓ Successfully removed %s players from team 111592 and added them to team %s",
+                              len(players_to_remove_from_111592), self.team_id)
 
                 return True
             else:
-                print(f"✗ Teamplayerlinks file not found: {file_path}")
+                log.error("✗ Teamplayerlinks file not found: %s", file_path)
                 return False
 
         except Exception as e:
-            print(f"✗ Error appending to teamplayerlinks file: {str(e)}")
+            log.error("✗ Error appending to teamplayerlinks file: %s", e)
             traceback.print_exc()  # Print full traceback for debugging
             return False
 
@@ -732,7 +862,7 @@ class TeamAppender:
         """
         try:
             if not self.is_national_team or self.nation_id is None:
-                print("Not a national team, skipping teamnationlinks.txt")
+                log.debug("Not a national team, skipping teamnationlinks.txt")
                 return True
 
             if os.path.exists(file_path):
@@ -740,8 +870,7 @@ class TeamAppender:
                 file_encoding = detect_file_encoding(file_path)
                 
                 # Read the existing content
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Create the new link line (league 78 for national teams)
                 nationlink_line = f"78\t{self.team_id}\t{self.nation_id}"
@@ -754,13 +883,13 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + nationlink_line)
 
-                print(f"✓ Added team-nation link to file: {file_path}")
+                log.debug("✓ Added team-nation link to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Teamnationlinks file not found: {file_path}")
+                log.error("✗ Teamnationlinks file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to teamnationlinks file: {str(e)}")
+            log.error("✗ Error appending to teamnationlinks file: %s", e)
             traceback.print_exc()
             return False
 
@@ -774,7 +903,7 @@ class TeamAppender:
         """
         try:
             if self.stadium_id is None:
-                print("No stadium ID specified, skipping teamstadiumlinks.txt")
+                log.debug("No stadium ID specified, skipping teamstadiumlinks.txt")
                 return True
 
             if os.path.exists(file_path):
@@ -782,8 +911,7 @@ class TeamAppender:
                 file_encoding = detect_file_encoding(file_path)
                 
                 # Read the existing content
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Create the new link line: 0	stadium_id	team_id	0
                 stadiumlink_line = f"0\t{self.stadium_id}\t{self.team_id}\t0"
@@ -796,13 +924,13 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + stadiumlink_line)
 
-                print(f"✓ Added team-stadium link to file: {file_path} (Stadium ID: {self.stadium_id})")
+                log.debug("✓ Added team-stadium link to file: %s (Stadium ID: %s)", file_path, self.stadium_id)
                 return True
             else:
-                print(f"✗ Teamstadiumlinks file not found: {file_path}")
+                log.error("✗ Teamstadiumlinks file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to teamstadiumlinks file: {str(e)}")
+            log.error("✗ Error appending to teamstadiumlinks file: %s", e)
             traceback.print_exc()
             return False
 
@@ -817,30 +945,16 @@ class TeamAppender:
         Returns:
             dict: Dictionary mapping column names to their indices
         """
-        try:
-            # Auto-detect encoding
-            file_encoding = detect_file_encoding(file_path)
-            with open(file_path, 'r', encoding=file_encoding) as file:
-                header_line = file.readline().strip()
-
-            if not header_line:
-                print(f"Warning: {file_type} file has no header line")
-                return {}
-
-            header_columns = header_line.split('\t')
-            header_dict = {col: idx for idx, col in enumerate(header_columns)}
-
-            print(f"Parsed header for {file_type}: Found {len(header_dict)} columns")
+        header_dict = read_file_header(file_path, file_type)
+        if header_dict:
             self.file_headers[file_type] = header_dict  # Store the header mapping
-
-            return header_dict
-        except Exception as e:
-            print(f"Error parsing header for {file_type} file: {str(e)}")
-            return {}
+        return header_dict
 
     def get_highest_id_from_file(self, file_path, column_idx, default_value=0):
         """
         Get the highest numeric value from a specific column in a file
+        The file is only rescanned when its mtime changes; our own appends keep the cached
+        value current through record_highest_id()
 
         Args:
             file_path (str): Path to the file
@@ -850,33 +964,56 @@ class TeamAppender:
         Returns:
             int: Highest value found, or default if none found
         """
-        try:
-            # Auto-detect encoding
-            file_encoding = detect_file_encoding(file_path)
-            with open(file_path, 'r', encoding=file_encoding) as file:
-                # Skip header
-                next(file)
-
-                # Process all other lines
-                id_values = []
-                for line in file:
-                    parts = line.strip().split('\t')
-                    if len(parts) > column_idx:
-                        try:
-                            id_val = parts[column_idx]
-                            if id_val.isdigit():
-                                id_values.append(int(id_val))
-                        except (ValueError, IndexError):
-                            pass
+        cache_key = (file_path, column_idx)
+        mtime_ns = _file_mtime_ns(file_path)
+        cached = _highest_id_cache.get(cache_key)
+        if cached is None or cached[0] != mtime_ns:
+            try:
+                # Auto-detect encoding
+                file_encoding = detect_file_encoding(file_path)
+                with open(file_path, 'r', encoding=file_encoding) as file:
+                    # Skip header
+                    next(file)
 
-            if id_values:
-                return max(id_values)
+                    # Process all other lines
+                    id_values = []
+                    for line in file:
+                        parts = line.strip().split('\t')
+                        if len(parts) > column_idx:
+                            try:
+                                id_val = parts[column_idx]
+                                if id_val.isdigit():
+                                    id_values.append(int(id_val))
+                            except (ValueError, IndexError):
+                                pass
 
-            return default_value
+                cached = (mtime_ns, max(id_values) if id_values else None)
+                _highest_id_cache[cache_key] = cached
 
-        except Exception as e:
-            print(f"Error getting highest ID: {str(e)}")
-            return default_value
+            except Exception as e:
+                log.error("Error getting highest ID: %s", e)
+                return default_value
+
+        highest_id = cached[1]
+        return highest_id if highest_id is not None else default_value
+
+    def record_highest_id(self, file_path, column_idx, id_value):
+        """
+        Keep the cached highest ID of a file column in step with rows we just appended.
+        Only call this for writes that kept every existing row, so the new highest ID is the
+        larger of the old one and id_value; files we removed rows from are simply rescanned.
+
+        Args:
+            file_path (str): Path to the file that was written
+            column_idx (int): Index of the ID column
+            id_value (int): Highest ID written to that column
+        """
+        cache_key = (file_path, column_idx)
+        cached = _highest_id_cache.get(cache_key)
+        if cached is not None:
+            highest_id = cached[1]
+            _highest_id_cache[cache_key] = (_file_mtime_ns(file_path),
+                                            id_value if highest_id is None else max(highest_id, id_value))
 
     def append_to_formations_file(self, file_path, selected_formation=None):
         """Append formation to the formations.txt file"""
@@ -889,94 +1026,36 @@ class TeamAppender:
                 formationid_idx = header_dict.get('formationid')
                 if formationid_idx is not None:
                     next_formation_id = self.get_highest_id_from_file(file_path, formationid_idx, 1) + 1
-                    print(f"Found formationid at column {formationid_idx}, next ID: {next_formation_id}")
+                    log.debug("Found formationid at column %s, next ID: %s", formationid_idx, next_formation_id)
                 else:
                     next_formation_id = 2
-                    print(f"Could not find formationid column, using default: {next_formation_id}")
+                    log.warning("Could not find formationid column, using default: %s", next_formation_id)
 
-                # Read the entire content to keep it (auto-detect encoding)
+                # Auto-detect encoding
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
 
-                # If user selected a specific formation, use that data
-                if selected_formation:
-                    # Build the formation template using the selected formation's data
-                    formations_template = (
-                        f"{selected_formation.get('offset6x', '0.65')}\t"
-                        f"{selected_formation.get('offset5y', '0.3375')}\t"
-                        f"{selected_formation.get('offset10x', '0.075')}\t"
-                        f"{selected_formation.get('offset2x', '0.6731')}\t"
-                        f"{selected_formation.get('defenders', '4')}\t"
-                        f"{selected_formation.get('offset2y', '0.1537')}\t"
-                        f"{selected_formation.get('offset6y', '0.5125')}\t"
-                        f"{selected_formation.get('offset7x', '0.35')}\t"
-                        f"{selected_formation.get('offset3x', '0.325')}\t"
-                        f"{selected_formation.get('offset8x', '0.925')}\t"
-                        f"{selected_formation.get('offset10y', '0.825')}\t"
-                        f"{selected_formation.get('offset3y', '0.15')}\t"
-                        f"{selected_formation.get('offset4x', '0.075')}\t"
-                        f"{selected_formation.get('offset7y', '0.5125')}\t"
-                        f"{selected_formation.get('offset0x', '0.497')}\t"
-                        f"{selected_formation.get('offset8y', '0.825')}\t"
-                        f"{selected_formation.get('attackers', '3')}\t"
-                        f"{selected_formation.get('offset9x', '0.4995')}\t"
-                        f"{selected_formation.get('midfielders', '3')}\t"
-                        f"{selected_formation.get('offset5x', '0.5')}\t"
-                        f"{selected_formation.get('offset0y', '0.0175')}\t"
-                        f"{selected_formation.get('offset1x', '0.9')}\t"
-                        f"{selected_formation.get('offset4y', '0.2')}\t"
-                        f"{selected_formation.get('offset9y', '0.875')}\t"
-                        f"{selected_formation.get('offset1y', '0.175')}\t"
-                        f"{selected_formation.get('pos0role', '4161')}\t"
-                        f"{selected_formation.get('pos6role', '21314')}\t"
-                        f"{selected_formation.get('pos8role', '33794')}\t"
-                        f"{selected_formation.get('pos4role', '8386')}\t"
-                        f"{selected_formation.get('pos7role', '21314')}\t"
-                        f"{selected_formation.get('pos2role', '12737')}\t"
-                        f"{selected_formation.get('pos1role', '8386')}\t"
-                        f"{selected_formation.get('pos10role', '33794')}\t"
-                        f"{selected_formation.get('pos3role', '12737')}\t"
-                        f"{selected_formation.get('pos9role', '12737')}\t"
-                        f"{selected_formation.get('pos5role', '17089')}\t"
-                        f"{selected_formation.get('name', '4-3-3')}\t"
-                        f"{selected_formation.get('position10', '27')}\t"
-                        f"{selected_formation.get('position6', '13')}\t"
-                        f"{selected_formation.get('offensiverating', '3')}\t"
-                        f"{selected_formation.get('position8', '23')}\t"
-                        f"{selected_formation.get('position5', '10')}\t"
-                        f"{selected_formation.get('audio_id', '6')}\t"
-                        f"{self.team_id}\t"
-                        f"{selected_formation.get('position2', '4')}\t"
-                        f"{next_formation_id}\t"  # Always use auto-incremented ID
-                        f"{selected_formation.get('relativeformationid', '9')}\t"
-                        f"{selected_formation.get('position4', '7')}\t"
-                        f"{selected_formation.get('position3', '6')}\t"
-                        f"{selected_formation.get('fullname_id', '7')}\t"
-                        f"{selected_formation.get('position0', '0')}\t"
-                        f"{selected_formation.get('position9', '25')}\t"
-                        f"{selected_formation.get('position7', '15')}\t"
-                        f"{selected_formation.get('position1', '3')}"
-                    )
-                else:
-                    # Template structure from the user's example with updated IDs
-                    formations_template = f"""0.65\t0.3375\t0.075\t0.6731\t4\t0.1537\t0.5125\t0.35\t0.325\t0.925\t0.825\t0.15\t0.075\t0.5125\t0.497\t0.825\t3\t0.4995\t3\t0.5\t0.0175\t0.9\t0.2\t0.875\t0.175\t4161\t21314\t33794\t8386\t21314\t12737\t8386\t33794\t12737\t12737\t17089\t4-3-3\t27\t13\t3\t23\t10\t6\t{self.team_id}\t4\t{next_formation_id}\t9\t7\t6\t7\t0\t25\t15\t3"""
+                # Build the row from the selected formation, falling back to the 4-3-3 defaults
+                # (the formation ID is always the auto-incremented one)
+                formations_template = _format_formation_row(selected_formation or {}, self.team_id, next_formation_id)
 
                 # Ensure there's a newline at the end of the original content
-                if content and not content.endswith('\n'):
-                    content += '\n'
+                if file_needs_newline(file_path, file_encoding):
+                    formations_template = '\n' + formations_template
 
-                # Append the new formation to the content and write back
-                with open(file_path, 'w', encoding=file_encoding) as file:
-                    file.write(content + formations_template)
+                # Append only the new formation instead of rewriting the whole file
+                with open(file_path, 'a', encoding=file_encoding) as file:
+                    file.write(formations_template)
+
+                if formationid_idx is not None:
+                    self.record_highest_id(file_path, formationid_idx, next_formation_id)
 
-                print(f"✓ Added formation to file: {file_path}")
+                log.debug("✓ Added formation to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Formations file not found: {file_path}")
+                log.error("✗ Formations file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to formations file: {str(e)}")
+            log.error("✗ Error appending to formations file: %s", e)
             traceback.print_exc()
             return False
 
@@ -990,10 +1069,9 @@ class TeamAppender:
             player_ids.append(player['playerid'])
 
         # Print for debugging
-        print("\nPlayer IDs for starting eleven:")
+        log.debug("Player IDs for starting eleven:")
         for i, pid in enumerate(player_ids):
-            print(f"Position {i}: {pid}")
-        print()
+            log.debug("Position %s: %s", i, pid)
 
         return player_ids
 
@@ -1006,8 +1084,7 @@ class TeamAppender:
 
                 # Read the entire content to keep it (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # New header structure (110 columns):
                 # assetid, teamcolor1g, teamcolor1r, clubworth, teamcolor2b, goalnetstanchioncolor2g,
@@ -1157,13 +1234,13 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + teams_template)
 
-                print(f"✓ Added team to teams file: {file_path}")
+                log.debug("✓ Added team to teams file: %s", file_path)
                 return True
             else:
-                print(f"✗ Teams file not found: {file_path}")
+                log.error("✗ Teams file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to teams file: {str(e)}")
+            log.error("✗ Error appending to teams file: %s", e)
             return False
 
     def append_to_teamsheets_file(self, file_path):
@@ -1179,8 +1256,8 @@ class TeamAppender:
                     player_id_dict[f"playerid{i}"] = str(player_ids_raw[i])
 
                 # Check if we have a limited squad from teamplayerlinks method
-                if hasattr(self, 'limited_squad') and self.is_national_team:
-                    print("Using previously limited squad for teamsheet")
+                if self.limited_squad is not None and self.is_national_team:
+                    log.debug("Using previously limited squad for teamsheet")
                     all_players = self.limited_squad
 
                     # Map the player IDs from the limited squad
@@ -1216,18 +1293,18 @@ class TeamAppender:
                         max_additional = 26 - 11
                         additional_players = additional_players[:max_additional]
 
-                    print(f"Additional players to assign: {len(additional_players)}")
+                    log.debug("Additional players to assign: %s", len(additional_players))
 
                     # Assign all additional players to positions 11+ (up to position 51)
                     max_additional_positions = 52 - 11  # positions 11 through 51
                     for i, player in enumerate(additional_players):
                         if i < max_additional_positions:
                             player_id_dict[f"playerid{i + 11}"] = str(player['playerid'])
-                            print(
-                                f"Assigned player {player.get('given', '')} {player.get('sur', '')} to playerid{i + 11}")
+                            log.debug("Assigned player %s %s to playerid%s",
+                                      player.get('given', ''), player.get('sur', ''), i + 11)
                         else:
-                            print(
-                                f"Warning: More than {max_additional_positions} additional players, some will not be assigned positions")
+                            log.warning("More than %s additional players, some will not be assigned positions",
+                                        max_additional_positions)
 
                 # Fill any missing positions with -1 (important for teamsheet structure)
                 for i in range(52):
@@ -1235,15 +1312,16 @@ class TeamAppender:
                         player_id_dict[f"playerid{i}"] = "-1"
 
                 # Debug - print the first 11 players to verify
-                print("\nTeamsheet player assignments:")
+                log.debug("Teamsheet player assignments:")
                 for i in range(11):
                     player = next(
                         (p for p in self.starting_eleven if str(p['playerid']) == player_id_dict[f"playerid{i}"]), None)
                     if player:
-                        print(
-                            f"playerid{i}: {player_id_dict[f'playerid{i}']} ({player.get('given', '')} {player.get('sur', '')} - {player.get('pos1', '')})")
+                        log.debug("playerid%s: %s (%s %s - %s)",
+                                  i, player_id_dict[f'playerid{i}'], player.get('given', ''), player.get('sur', ''),
+                                  player.get('pos1', ''))
                     else:
-                        print(f"playerid{i}: {player_id_dict[f'playerid{i}']} (Unknown)")
+                        log.debug("playerid%s: %s (Unknown)", i, player_id_dict[f'playerid{i}'])
 
                 # Define the exact teamsheet structure from the header
                 teamsheet_structure = [
@@ -1265,7 +1343,7 @@ class TeamAppender:
 
                 # Calculate total available players (starters + reserves)
                 total_available = len(self.starting_eleven) + len(additional_players)
-                print(f"Total available players: {total_available}")
+                log.debug("Total available players: %s", total_available)
 
                 # Create the values list with special handling for non-player positions
                 teamsheet_values = []
@@ -1330,8 +1408,7 @@ class TeamAppender:
 
                 # Read the existing content (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Ensure there's a newline at the end
                 if content and not content.endswith('\n'):
@@ -1341,13 +1418,13 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + teamsheet_template)
 
-                print(f"✓ Added teamsheet to file: {file_path} with all {total_available} available players")
+                log.debug("✓ Added teamsheet to file: %s with all %s available players", file_path, total_available)
                 return True
             else:
-                print(f"✗ Teamsheets file not found: {file_path}")
+                log.error("✗ Teamsheets file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to teamsheets file: {str(e)}")
+            log.error("✗ Error appending to teamsheets file: %s", e)
             traceback.print_exc()  # Print full trace for debugging
             return False
 
@@ -1362,15 +1439,14 @@ class TeamAppender:
                 mentalityid_idx = header_dict.get('mentalityid')
                 if mentalityid_idx is not None:
                     next_mentality_id = self.get_highest_id_from_file(file_path, mentalityid_idx, 3) + 1
-                    print(f"Found mentalityid at column {mentalityid_idx}, next ID: {next_mentality_id}")
+                    log.debug("Found mentalityid at column %s, next ID: %s", mentalityid_idx, next_mentality_id)
                 else:
                     next_mentality_id = 4
-                    print(f"Could not find mentalityid column, using default: {next_mentality_id}")
+                    log.warning("Could not find mentalityid column, using default: %s", next_mentality_id)
 
                 # Read the existing content (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Get our consistent player IDs - SAME as used in teamsheet
                 player_ids_raw = self.player_ids if self.player_ids else self.get_starting_player_ids()
@@ -1403,7 +1479,7 @@ class TeamAppender:
                     # Create a copy of the formation data to avoid modifying the original
                     formation_data = selected_formation.copy()
                     # Log the formation being used
-                    print(f"Using formation {formation_data.get('name', '4-3-3')} for mentalities")
+                    log.debug("Using formation %s for mentalities", formation_data.get('name', '4-3-3'))
 
                     # Use formation-specific values when available
                     sample_values = {
@@ -1476,7 +1552,7 @@ class TeamAppender:
                         "position2": "4", "position4": "7", "position3": "6", "formationfullnameid": "7",
                         "position0": "0", "position9": "25", "position7": "15", "position1": "3"
                     }
-                    print("Using default 4-3-3 formation data for mentalities")
+                    log.debug("Using default 4-3-3 formation data for mentalities")
 
                 # First mentality (active)
                 mentality_values = []
@@ -1520,13 +1596,16 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + mentalities_template)
 
-                print(f"✓ Added mentalities to file: {file_path}")
+                if mentalityid_idx is not None:
+                    self.record_highest_id(file_path, mentalityid_idx, next_mentality_id + 2)
+
+                log.debug("✓ Added mentalities to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Mentalities file not found: {file_path}")
+                log.error("✗ Mentalities file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to mentalities file: {str(e)}")
+            log.error("✗ Error appending to mentalities file: %s", e)
             traceback.print_exc()
             return False
 
@@ -1541,15 +1620,14 @@ class TeamAppender:
                 artificialkey_idx = header_dict.get('artificialkey')
                 if artificialkey_idx is not None:
                     next_key = self.get_highest_id_from_file(file_path, artificialkey_idx, 0) + 1
-                    print(f"Found artificialkey at column {artificialkey_idx}, next key: {next_key}")
+                    log.debug("Found artificialkey at column %s, next key: %s", artificialkey_idx, next_key)
                 else:
                     next_key = 1
-                    print(f"Could not find artificialkey column, using default: {next_key}")
+                    log.warning("Could not find artificialkey column, using default: %s", next_key)
 
                 # Read the entire content to keep it (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Template structure from the user's example
                 leagueteamlinks_template = f"""0\t1\t0\t1\t0\t0\t0\t0\t0\t0\t0\t0\t{self.league_id}\t{self.league_id}\t0\t0\t0\t0\t{next_key}\t0\t{self.team_id}\t0\t0\t0\t0\t0\t0\t0\t-1\t0\t0\t0\t0\t0"""
@@ -1562,13 +1640,16 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + leagueteamlinks_template)
 
-                print(f"✓ Added league team link to file: {file_path}")
+                if artificialkey_idx is not None:
+                    self.record_highest_id(file_path, artificialkey_idx, next_key)
+
+                log.debug("✓ Added league team link to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Leagueteamlinks file not found: {file_path}")
+                log.error("✗ Leagueteamlinks file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to leagueteamlinks file: {str(e)}")
+            log.error("✗ Error appending to leagueteamlinks file: %s", e)
             traceback.print_exc()
             return False
 
@@ -1583,15 +1664,14 @@ class TeamAppender:
                 managerid_idx = header_dict.get('managerid')
                 if managerid_idx is not None:
                     next_manager_id = self.get_highest_id_from_file(file_path, managerid_idx, 254782) + 1
-                    print(f"Found managerid at column {managerid_idx}, next ID: {next_manager_id}")
+                    log.debug("Found managerid at column %s, next ID: %s", managerid_idx, next_manager_id)
                 else:
                     next_manager_id = 254783
-                    print(f"Could not find managerid column, using default: {next_manager_id}")
+                    log.warning("Could not find managerid column, using default: %s", next_manager_id)
 
                 # Read the entire content to keep it (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # New header structure (53 columns):
                 # starrating, firstname, commonname, surname, eyebrowcode, skintypecode, haircolorcode,
@@ -1670,13 +1750,16 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + manager_template)
 
-                print(f"✓ Added manager to file: {file_path}")
+                if managerid_idx is not None:
+                    self.record_highest_id(file_path, managerid_idx, next_manager_id)
+
+                log.debug("✓ Added manager to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Manager file not found: {file_path}")
+                log.error("✗ Manager file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to manager file: {str(e)}")
+            log.error("✗ Error appending to manager file: %s", e)
             traceback.print_exc()
             return False
 
@@ -1686,8 +1769,7 @@ class TeamAppender:
             if os.path.exists(file_path):
                 # Read the entire content to keep it (auto-detect encoding)
                 file_encoding = detect_file_encoding(file_path)
-                with open(file_path, 'r', encoding=file_encoding) as file:
-                    content = file.read()
+                content = read_text_file(file_path, file_encoding)
 
                 # Find all kit IDs at the start of lines
                 kit_ids = re.findall(r'^(\d+)', content, re.MULTILINE)
@@ -1698,11 +1780,11 @@ class TeamAppender:
                     try:
                         highest_kit_id = max([int(kid) for kid in kit_ids if kid.isdigit()])
                         next_kit_id = highest_kit_id + 1
-                        print(f"Found {len(kit_ids)} kit IDs. Highest: {highest_kit_id}, Next: {next_kit_id}")
+                        log.debug("Found %s kit IDs. Highest: %s, Next: %s", len(kit_ids), highest_kit_id, next_kit_id)
                     except (ValueError, IndexError):
-                        print(f"Warning: Could not parse kit IDs, using default: {next_kit_id}")
+                        log.warning("Could not parse kit IDs, using default: %s", next_kit_id)
                 else:
-                    print(f"No kit IDs found, using default: {next_kit_id}")
+                    log.debug("No kit IDs found, using default: %s", next_kit_id)
 
                 # New header structure (72 columns):
                 # teamkitid, chestbadge, shortsnumberplacementcode, shortsnumbercolorprimg, teamcolorsecb,
@@ -1961,13 +2043,13 @@ class TeamAppender:
                 with open(file_path, 'w', encoding=file_encoding) as file:
                     file.write(content + teamkits_template)
 
-                print(f"✓ Added team kits to file: {file_path}")
+                log.debug("✓ Added team kits to file: %s", file_path)
                 return True
             else:
-                print(f"✗ Teamkits file not found: {file_path}")
+                log.error("✗ Teamkits file not found: %s", file_path)
                 return False
         except Exception as e:
-            print(f"✗ Error appending to teamkits file: {str(e)}")
+            log.error("✗ Error appending to teamkits file: %s", e)
             return False
 
     def process_files(self, input_dir, selected_formation=None):
@@ -1978,18 +2060,18 @@ class TeamAppender:
             input_dir (str): Directory containing all input files
             selected_formation (dict, optional): Formation data to use
         """
-        print("\n" + "=" * 50)
-        print(f"TEAM CREATION: {self.team_name} (ID: {self.team_id})")
-        print(f"League ID: {self.league_id}")
-        print(f"Captain ID: {self.captain_id}")
+        log.debug("=" * 50)
+        log.debug("TEAM CREATION: %s (ID: %s)", self.team_name, self.team_id)
+        log.debug("League ID: %s", self.league_id)
+        log.debug("Captain ID: %s", self.captain_id)
         if self.is_national_team:
-            print(f"Nation ID: {self.nation_id}")
+            log.debug("Nation ID: %s", self.nation_id)
         if self.stadium_id is not None:
-            print(f"Stadium ID: {self.stadium_id}")
+            log.debug("Stadium ID: %s", self.stadium_id)
         if selected_formation:
-            print(f"Formation: {selected_formation['name']}")
-        print(f"Directory: {input_dir}")
-        print("=" * 50 + "\n")
+            log.debug("Formation: %s", selected_formation['name'])
+        log.debug("Directory: %s", input_dir)
+        log.debug("=" * 50)
 
         # List of files to process and their corresponding methods
         file_processes = [
@@ -2025,97 +2107,84 @@ class TeamAppender:
                 error_count += 1
 
         # Print summary
-        print("\n" + "=" * 50)
-        print(f"PROCESSING COMPLETE: {success_count} files modified successfully, {error_count} errors")
-        print("=" * 50 + "\n")
+        log.debug("=" * 50)
+        log.debug("PROCESSING COMPLETE: %s files modified successfully, %s errors", success_count, error_count)
+        log.debug("=" * 50)
 
         return success_count > 0
 
 
-def process_multiple_teams(team_files, starting_team_id, league_id, input_dir, is_national_teams=False,
-                           players_txt_path=None, nation_id_map=None):
+def _build_national_team(job):
     """
-    Process multiple teams one after another
+    Load one national team's players and pick its squad; no game files are touched here.
 
     Args:
-        team_files (list): List of paths to player CSV/TXT files (or nation names for national teams)
-        starting_team_id (int): ID to assign to the first team
-        league_id (int): League ID to use for all teams (78 for national teams)
-        input_dir (str): Directory containing all game files
-        is_national_teams (bool): Whether these are national teams
-        players_txt_path (str): Path to players.txt file for national teams
-        nation_id_map (dict): Mapping of nation names to nation IDs
+        job (tuple): (nation_name, team_id, league_id, nation_id, nation_rows), where nation_rows are this
+            nation's rows from load_players_grouped_by_nation(), so players.txt is not re-read per team
 
     Returns:
-        int: Number of teams successfully processed
+        TeamAppender or None: Appender ready for process_files(), or None if the players could not be loaded
     """
-    print(f"\nProcessing {len(team_files)} teams starting with ID: {starting_team_id}")
+    nation_name, team_id, league_id, nation_id, nation_rows = job
+    appender = TeamAppender(nation_name, team_id, league_id, nation_id, is_national_team=True)
+    if appender.load_player_data_from_rows(nation_rows):
+        return appender
+    return None
 
-    if is_national_teams:
-        print("Processing as NATIONAL TEAMS")
-        print(f"Using players.txt file: {players_txt_path}")
-        league_id = 78  # Always 78 for national teams
 
-    print(f"All teams will be assigned to league ID: {league_id}")
+def _team_name_from_path(player_file):
+    """Club team name for a player file: its file name without a .csv/.txt extension (any case)"""
+    base_name = os.path.basename(player_file)
+    team_name, ext = os.path.splitext(base_name)
+    return team_name if ext.lower() in ('.csv', '.txt') else base_name
 
-    success_count = 0
-    current_team_id = starting_team_id
 
-    for i, team_file_or_name in enumerate(team_files):
-        try:
-            if is_national_teams:
-                # For national teams, team_file_or_name is the nation name
-                team_name = team_file_or_name
-                nation_id = nation_id_map.get(team_name)
+# Upper bound on threads loading batch teams' player data while earlier teams are written
+MAX_LOADER_THREADS = 8
 
-                if not nation_id:
-                    print(f"✗ Could not find nation ID for {team_name}. Skipping.")
-                    continue
 
-                print(
-                    f"\nProcessing national team {i + 1}/{len(team_files)}: {team_name} (ID: {current_team_id}, Nation ID: {nation_id})")
+def _load_batch_team(team_file, league_id):
+    """
+    Load one club team's players and pick its squad, without touching any game files.
+    The team ID is left unset; process_multiple_teams() hands IDs out in order as teams are written.
 
-                # Create a team appender for this national team
-                appender = TeamAppender(team_name, current_team_id, league_id, nation_id, is_national_team=True)
+    Args:
+        team_file (str): Player CSV/TXT file
+        league_id (int): League ID for the team
 
-                # Load player data from players.txt
-                if not appender.load_player_data(players_txt_path):
-                    print(f"✗ Failed to load player data for {team_name}. Skipping.")
-                    continue
-            else:
-                # Regular club team processing
-                team_file = team_file_or_name
+    Returns:
+        tuple: (team_name, appender, error) - appender is None and error is set if the team can't be created
+    """
+    # Extract team name from the filename
+    team_name = _team_name_from_path(team_file)
+    appender = TeamAppender(team_name, None, league_id)
 
-                # Extract team name from the filename
-                team_name = os.path.basename(team_file)
-                if team_name.lower().endswith('.csv') or team_name.lower().endswith('.txt'):
-                    team_name = team_name[:-4]  # Remove extension
+    if not appender.load_player_data(team_file):
+        return team_name, None, f"✗ Failed to load player data for {team_name}. Skipping."
+    return team_name, appender, None
 
-                print(f"\nProcessing team {i + 1}/{len(team_files)}: {team_name} (ID: {current_team_id})")
 
-                # Create a team appender for this team
-                appender = TeamAppender(team_name, current_team_id, league_id)
+def run_with_responsive_ui(root, func, *args, **kwargs):
+    """
+    Run func on a worker thread and keep the Tk event loop going until it finishes.
+    func must not touch Tk itself; any dialogs belong to the caller, after this returns.
 
-                # Load player data
-                if not appender.load_player_data(team_file):
-                    print(f"✗ Failed to load player data for {team_name}. Skipping.")
-                    continue
+    Returns:
+        The return value of func (exceptions are re-raised here, on the main thread)
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(func, *args, **kwargs)
+        finished = tk.BooleanVar(root, value=False)
 
-            # Process all files
-            if appender.process_files(input_dir):
-                success_count += 1
-                print(f"✓ Team {team_name} processed successfully.")
+        def poll():
+            if future.done():
+                finished.set(True)
             else:
-                print(f"✗ Some errors occurred while processing team {team_name}.")
-
-            # Increment team ID for the next team
-            current_team_id += 1
-        except Exception as e:
-            print(f"✗ Error processing team {team_file_or_name}: {str(e)}")
-            traceback.print_exc()
-            continue
+                root.after(50, poll)
 
-    return success_count
+        root.after(50, poll)
+        root.wait_variable(finished)
+    return future.result()
 
 
 def load_blacklisted_players():
@@ -2143,102 +2212,48 @@ def load_blacklisted_players():
     return blacklist_set
 
 
+@functools.lru_cache(maxsize=1)
 def load_nation_id_mapping():
-    """Load the mapping of nation names to nation IDs directly from FIFA's data"""
+    """
+    Load the mapping of nation names to nation IDs from nations.json.
+    The file ships next to this script and is only read on first use.
+    """
     print("Loading nation ID mapping")
 
-    # Direct mapping of nation names to IDs based on provided FIFA data
-    nation_mapping = {
-        "Albania": 1, "Andorra": 2, "Armenia": 3, "Austria": 4, "Azerbaijan": 5,
-        "Belarus": 6, "Belgium": 7, "Bosnia and Herzegovina": 8, "Bulgaria": 9, "Croatia": 10,
-        "Cyprus": 11, "Czech Republic": 12, "Denmark": 13, "England": 14, "Montenegro": 15,
-        "Faroe Islands": 16, "Finland": 17, "France": 18, "North Macedonia": 19, "Georgia": 20,
-        "Germany": 21, "Greece": 22, "Hungary": 23, "Iceland": 24, "Republic of Ireland": 25,
-        "Israel": 26, "Italy": 27, "Latvia": 28, "Liechtenstein": 29, "Lithuania": 30,
-        "Luxembourg": 31, "Malta": 32, "Moldova": 33, "Holland": 34, "Northern Ireland": 35,
-        "Norway": 36, "Poland": 37, "Portugal": 38, "Romania": 39, "Russia": 40,
-        "San Marino": 41, "Scotland": 42, "Slovakia": 43, "Slovenia": 44, "Spain": 45,
-        "Sweden": 46, "Switzerland": 47, "Turkey": 48, "Ukraine": 49, "Wales": 50,
-        "Serbia": 51, "Argentina": 52, "Bolivia": 53, "Brazil": 54, "Chile": 55,
-        "Colombia": 56, "Ecuador": 57, "Paraguay": 58, "Peru": 59, "Uruguay": 60,
-        "Venezuela": 61, "Anguilla": 62, "Antigua and Barbuda": 63, "Aruba": 64, "Bahamas": 65,
-        "Barbados": 66, "Belize": 67, "Bermuda": 68, "British Virgin Islands": 69, "Canada": 70,
-        "Cayman Islands": 71, "Costa Rica": 72, "Cuba": 73, "Dominica": 74, "International": 75,
-        "El Salvador": 76, "Grenada": 77, "Guatemala": 78, "Guyana": 79, "Haiti": 80,
-        "Honduras": 81, "Jamaica": 82, "Mexico": 83, "Montserrat": 84, "Curaçao": 85,
-        "Nicaragua": 86, "Panama": 87, "Puerto Rico": 88, "St. Kitts and Nevis": 89, "St. Lucia": 90,
-        "St. Vincent and the Grenadines": 91, "Suriname": 92, "Trinidad and Tobago": 93,
-        "Turks and Caicos Islands": 94, "United States": 95, "US Virgin Islands": 96, "Algeria": 97,
-        "Angola": 98, "Benin": 99, "Botswana": 100, "Burkina Faso": 101, "Burundi": 102,
-        "Cameroon": 103, "Cape Verde Islands": 104, "Central African Republic": 105, "Chad": 106,
-        "Congo": 107, "Côte d'Ivoire": 108, "Djibouti": 109, "Congo DR": 110, "Egypt": 111,
-        "Equatorial Guinea": 112, "Eritrea": 113, "Ethiopia": 114, "Gabon": 115, "Gambia": 116,
-        "Ghana": 117, "Guinea": 118, "Guinea-Bissau": 119, "Kenya": 120, "Lesotho": 121,
-        "Liberia": 122, "Libya": 123, "Madagascar": 124, "Malawi": 125, "Mali": 126,
-        "Mauritania": 127, "Mauritius": 128, "Morocco": 129, "Mozambique": 130, "Namibia": 131,
-        "Niger": 132, "Nigeria": 133, "Rwanda": 134, "São Tomé e Príncipe": 135, "Senegal": 136,
-        "Seychelles": 137, "Sierra Leone": 138, "Somalia": 139, "South Africa": 140, "Sudan": 141,
-        "Eswatini": 142, "Tanzania": 143, "Togo": 144, "Tunisia": 145, "Uganda": 146,
-        "Zambia": 147, "Zimbabwe": 148, "Afghanistan": 149, "Bahrain": 150, "Bangladesh": 151,
-        "Bhutan": 152, "Brunei Darussalam": 153, "Cambodia": 154, "China PR": 155, "Guam": 157,
-        "Hong Kong": 158, "India": 159, "Indonesia": 160, "Iran": 161, "Iraq": 162, "Japan": 163,
-        "Jordan": 164, "Kazakhstan": 165, "Korea DPR": 166, "Korea Republic": 167, "Kuwait": 168,
-        "Kyrgyzstan": 169, "Laos": 170, "Lebanon": 171, "Macau": 172, "Malaysia": 173,
-        "Maldives": 174, "Mongolia": 175, "Myanmar": 176, "Nepal": 177, "Oman": 178,
-        "Pakistan": 179, "Palestine": 180, "Philippines": 181, "Qatar": 182, "Saudi Arabia": 183,
-        "Singapore": 184, "Sri Lanka": 185, "Syria": 186, "Tajikistan": 187, "Thailand": 188,
-        "Turkmenistan": 189, "United Arab Emirates": 190, "Uzbekistan": 191, "Vietnam": 192,
-        "Yemen": 193, "American Samoa": 194, "Australia": 195, "Cook Islands": 196, "Fiji": 197,
-        "New Zealand": 198, "Papua New Guinea": 199, "Samoa": 200, "Solomon Islands": 201,
-        "Tahiti": 202, "Tonga": 203, "Vanuatu": 204, "Gibraltar": 205, "Greenland": 206,
-        "Dominican Republic": 207, "Estonia": 208, "Timor-Leste": 212, "Chinese Taipei": 213,
-        "Comoros": 214, "New Caledonia": 215, "South Sudan": 218, "Kosovo": 219
-    }
+    nations_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nations.json")
+    with open(nations_path, 'r', encoding='utf-8') as f:
+        nation_mapping = json.load(f)
 
     print(f"Loaded {len(nation_mapping)} nations")
     return nation_mapping
 
-    print("Parsing nation data")
-    # Parse the nation data
-    parts = nation_data.strip().split()
-    i = 0
-    while i < len(parts):
-        try:
-            if i + 1 < len(parts):
-                # Try to extract name and ID
-                if parts[i + 1].isdigit():
-                    # Simple case: "Albania 1"
-                    name = parts[i]
-                    nation_id = int(parts[i + 1])
-                    nation_mapping[name] = nation_id
-                    i += 2
-                else:
-                    # Multi-word name case: "Bosnia and Herzegovina 8"
-                    name = parts[i]
-                    j = i + 1
-                    # Keep adding words until we find a digit
-                    while j < len(parts) and not parts[j].isdigit():
-                        name += " " + parts[j]
-                        j += 1
-
-                    if j < len(parts) and parts[j].isdigit():
-                        nation_id = int(parts[j])
-                        nation_mapping[name] = nation_id
-
-                    i = j + 1
-            else:
-                i += 1
-        except Exception as e:
-            print(f"Error parsing nation at position {i}: {e}")
-            i += 1
 
-    print(f"Loaded {len(nation_mapping)} nations")
-    return nation_mapping
+def build_nation_matcher(nation_names):
+    """
+    Build a lookup for partial (case-insensitive substring) nation name matches.
+    Names are lowercased once and each query's result is memoized, so repeated
+    prompts for the same text don't rescan every nation.
+
+    Args:
+        nation_names (iterable): Nation names, in the order matches should be returned
+
+    Returns:
+        function: match(query) -> tuple of matching nation names
+    """
+    lowered_names = [(name, name.lower()) for name in nation_names]
+
+    @functools.lru_cache(maxsize=256)
+    def match(query):
+        query = query.lower()
+        return tuple(name for name, lowered in lowered_names if query in lowered)
+
+    return match
 
 
 def get_existing_team_ids(teams_txt_path):
     """
     Scan teams.txt to get all existing team IDs.
+    The result is cached until teams.txt changes on disk; treat it as read-only.
     
     Args:
         teams_txt_path (str): Path to teams.txt file
@@ -2246,10 +2261,15 @@ def get_existing_team_ids(teams_txt_path):
     Returns:
         dict: Dictionary mapping team_id to team_name
     """
-    existing_teams = {}
     if not teams_txt_path or not os.path.exists(teams_txt_path):
-        return existing_teams
-    
+        return {}
+    return _read_existing_team_ids(teams_txt_path, os.path.getmtime(teams_txt_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_existing_team_ids(teams_txt_path, mtime):
+    """Read the team ID -> name mapping from teams.txt (mtime only keys the cache)"""
+    existing_teams = {}
     try:
         file_encoding = detect_file_encoding(teams_txt_path)
         with open(teams_txt_path, 'r', encoding=file_encoding) as f:
@@ -2345,6 +2365,107 @@ def load_team_id_mappings(filepath):
         return None
 
 
+@functools.lru_cache(maxsize=2)
+def _load_players_table(players_txt_path, mtime):
+    """
+    Parse players.txt once and group the rows by nationality.
+    Non-male players are dropped before any per-row data is built. The blacklist is
+    not applied here - callers filter with eligible_players() on every use, so the
+    cached table never goes stale when the blacklist changes.
+
+    The result is cached per (path, mtime), so repeated previews only pay for the
+    parse again when the file changes on disk.
+
+    Args:
+        players_txt_path (str): Path to players.txt
+        mtime (float): Modification time of the file, used as part of the cache key
+
+    Returns:
+        dict: nationality -> list of (player_id, position, ovr, name) tuples,
+              or None if a required column is missing
+    """
+    players_by_nation = {}
+
+    with open(players_txt_path, 'r', encoding='utf-16-le', newline='', buffering=1024 * 1024) as file:
+        # csv.reader tokenizes in C, which is much faster than splitting each line in Python
+        reader = csv.reader(file, delimiter='\t', quoting=csv.QUOTE_NONE)
+        headers = next(reader, [])
+
+        column_indices = {col.strip().lower(): idx for idx, col in enumerate(headers)}
+
+        playerid_idx = column_indices.get('playerid')
+        nationality_idx = column_indices.get('nationality')
+        gender_idx = column_indices.get('gender')
+        position_idx = column_indices.get('preferredposition1')
+        ovr_idx = column_indices.get('overallrating')
+        firstname_idx = column_indices.get('firstname', -1)
+        surname_idx = column_indices.get('surname', -1)
+
+        if None in [playerid_idx, nationality_idx, gender_idx, position_idx, ovr_idx]:
+            return None
+
+        max_idx = max(playerid_idx, nationality_idx, gender_idx, position_idx, ovr_idx)
+
+        # Pull only the five numeric columns we need in a single C-level call per row
+        get_numeric_fields = operator.itemgetter(playerid_idx, nationality_idx, gender_idx, position_idx, ovr_idx)
+
+        for parts in reader:
+            if len(parts) <= max_idx:
+                continue
+
+            try:
+                player_id, nationality, gender, position, ovr = map(int, get_numeric_fields(parts))
+            except ValueError:
+                continue
+
+            # Filter before building names or touching the group table
+            if gender != 0:
+                continue
+
+            firstname = parts[firstname_idx] if 0 <= firstname_idx < len(parts) else ""
+            surname = parts[surname_idx] if 0 <= surname_idx < len(parts) else ""
+            name = f"{firstname} {surname}".strip() or f"Player {player_id}"
+
+            players_by_nation.setdefault(nationality, []).append((player_id, position, ovr, name))
+
+    return players_by_nation
+
+
+def eligible_players(rows, blacklisted_players):
+    """Drop blacklisted players from a nation's rows of the cached players table"""
+    return [row for row in rows if row[0] not in blacklisted_players]
+
+
+def load_players_grouped_by_nation(players_txt_path, nation_id_map, nation_names=None):
+    """
+    Read players.txt once and group the eligible players by nation name
+
+    Args:
+        players_txt_path (str): Path to the players.txt file
+        nation_id_map (dict): Mapping of nation names to nation IDs
+        nation_names (iterable, optional): Only keep these nations (default: every nation in the map)
+
+    Returns:
+        dict: Nation name -> list of (player_id, position, ovr, name) tuples
+    """
+    players_by_nation = _load_players_table(players_txt_path, os.path.getmtime(players_txt_path))
+    if players_by_nation is None:
+        log.error("✗ Could not read player data from %s", players_txt_path)
+        return {}
+
+    if nation_names is None:
+        nation_names = nation_id_map
+
+    blacklisted_players = load_blacklisted_players()
+
+    grouped = {}
+    for name in nation_names:
+        nation_id = nation_id_map.get(name)
+        if nation_id in players_by_nation:
+            grouped[name] = eligible_players(players_by_nation[nation_id], blacklisted_players)
+    return grouped
+
+
 def get_starting_xi_preview(players_txt_path, nation_id, nation_name):
     """
     Get a preview of the starting XI for a nation.
@@ -2357,9 +2478,6 @@ def get_starting_xi_preview(players_txt_path, nation_id, nation_name):
     Returns:
         str: Formatted string showing the starting XI preview
     """
-    # Load blacklisted players
-    blacklisted_players = load_blacklisted_players()
-    
     players_by_position = {
         'GK': [],
         'DEF': [],
@@ -2375,50 +2493,19 @@ def get_starting_xi_preview(players_txt_path, nation_id, nation_name):
     }
     
     try:
-        with open(players_txt_path, 'r', encoding='utf-16-le') as file:
-            header_line = file.readline().strip()
-            headers = header_line.split('\t')
-            
-            column_indices = {col.lower(): idx for idx, col in enumerate(headers)}
-            
-            playerid_idx = column_indices.get('playerid')
-            nationality_idx = column_indices.get('nationality')
-            gender_idx = column_indices.get('gender')
-            position_idx = column_indices.get('preferredposition1')
-            ovr_idx = column_indices.get('overallrating')
-            firstname_idx = column_indices.get('firstname', -1)
-            surname_idx = column_indices.get('surname', -1)
-            
-            if None in [playerid_idx, nationality_idx, gender_idx, position_idx, ovr_idx]:
-                return f"Could not read player data for {nation_name}"
-            
-            for line in file:
-                parts = line.strip().split('\t')
-                if len(parts) <= max(playerid_idx, nationality_idx, gender_idx, position_idx, ovr_idx):
-                    continue
-                
-                try:
-                    player_id = int(parts[playerid_idx])
-                    nationality = int(parts[nationality_idx])
-                    gender = int(parts[gender_idx])
-                    position = int(parts[position_idx])
-                    ovr = int(parts[ovr_idx])
-                    
-                    if player_id in blacklisted_players or gender != 0 or nationality != nation_id:
-                        continue
-                    
-                    firstname = parts[firstname_idx] if firstname_idx >= 0 and firstname_idx < len(parts) else ""
-                    surname = parts[surname_idx] if surname_idx >= 0 and surname_idx < len(parts) else ""
-                    name = f"{firstname} {surname}".strip() or f"Player {player_id}"
-                    
-                    pos_cat = position_map.get(position, 'MID')
-                    players_by_position[pos_cat].append({
-                        'name': name,
-                        'ovr': ovr,
-                        'id': player_id
-                    })
-                except (ValueError, IndexError):
-                    continue
+        # Parsed table is cached until players.txt changes on disk
+        players_by_nation = _load_players_table(players_txt_path, os.path.getmtime(players_txt_path))
+        if players_by_nation is None:
+            return f"Could not read player data for {nation_name}"
+        
+        for player_id, position, ovr, name in eligible_players(players_by_nation.get(nation_id, ()),
+                                                               load_blacklisted_players()):
+            pos_cat = position_map.get(position, 'MID')
+            players_by_position[pos_cat].append({
+                'name': name,
+                'ovr': ovr,
+                'id': player_id
+            })
         
         # Sort by OVR and pick best players
         for pos in players_by_position:
@@ -2456,6 +2543,15 @@ def get_starting_xi_preview(players_txt_path, nation_id, nation_name):
         return f"Error getting preview for {nation_name}: {e}"
 
 
+@functools.lru_cache(maxsize=128)
+def cached_starting_xi_preview(players_txt_path, nation_id, mtime, nation_name):
+    """
+    Memoized get_starting_xi_preview(); pass os.path.getmtime(players_txt_path) as mtime
+    so an edited players.txt gets a fresh preview
+    """
+    return get_starting_xi_preview(players_txt_path, nation_id, nation_name)
+
+
 def scan_nations_in_players_file(players_txt_path, nation_id_map, min_players=11, teams_txt_path=None):
     """
     Scan players.txt to count how many players are available per nation.
@@ -2503,20 +2599,30 @@ def scan_nations_in_players_file(players_txt_path, nation_id_map, min_players=11
                         break
                 
                 if teamname_idx is not None:
+                    # Exact spellings ("<nation>" and "<nation> nt") map straight to their nation, so most
+                    # rows need a single dict lookup. "<nation> national" stays a substring check, done
+                    # only for rows that mention "national".
+                    surface_forms = {}
+                    national_forms = []
+                    for nation_name in nation_id_map:
+                        lowered = nation_name.lower()
+                        surface_forms.setdefault(lowered, nation_name)
+                        surface_forms.setdefault(f"{lowered} nt", nation_name)
+                        national_forms.append((f"{lowered} national", nation_name))
+
                     for line in f:
                         parts = line.strip().split('\t')
                         if len(parts) > teamname_idx:
-                            team_name = parts[teamname_idx].strip()
+                            team_name = parts[teamname_idx].strip().lower()
                             # Skip women's national teams
-                            if 'women' in team_name.lower():
+                            if 'women' in team_name:
                                 continue
                             # Check if it looks like a national team (matches a nation name)
-                            for nation_name in nation_id_map.keys():
-                                if nation_name.lower() == team_name.lower() or \
-                                   f"{nation_name} national" in team_name.lower() or \
-                                   team_name.lower() == f"{nation_name.lower()} nt":
-                                    created_national_teams.add(nation_name)
-                                    break
+                            nation_name = surface_forms.get(team_name)
+                            if nation_name is None and 'national' in team_name:
+                                nation_name = next((name for form, name in national_forms if form in team_name), None)
+                            if nation_name:
+                                created_national_teams.add(nation_name)
             
             if created_national_teams:
                 print(f"Found {len(created_national_teams)} national teams already in teams.txt: {', '.join(sorted(created_national_teams))}")
@@ -2641,6 +2747,45 @@ def scan_nations_in_players_file(players_txt_path, nation_id_map, min_players=11
         return {}
 
 
+# Display labels for the classify_nation() results, shared by the console scan and the availability dialog
+_NATION_STATUS = {"viable": "✓ VIABLE", "possible": "○ POSSIBLE", "low": "✗ NEEDS MORE"}
+_NATION_STATUS_GLYPH = {key: label[:2] for key, label in _NATION_STATUS.items()}
+
+
+def classify_nation(total, gk):
+    """
+    Classify a scanned nation by how complete a squad it can field
+
+    Args:
+        total (int): Number of eligible players
+        gk (int): Number of eligible goalkeepers
+
+    Returns:
+        str: "viable" (23+ players, 2+ GK), "possible" (11+ players, 1+ GK) or "low"
+    """
+    if total >= 23 and gk >= 2:
+        return "viable"
+    if total >= 11 and gk >= 1:
+        return "possible"
+    return "low"
+
+
+def sort_nation_stats(nation_stats):
+    """
+    Sort scanned nations by total players (descending), then by name
+
+    Args:
+        nation_stats (dict): Nation stats from scan_nations_in_players_file()
+
+    Returns:
+        list: Stats dicts in display order
+    """
+    # Build the sort keys once up front; names are unique so the stats dicts are never compared
+    decorated = [(-stats['total'], stats['name'], stats) for stats in nation_stats.values()]
+    decorated.sort()
+    return [stats for _, _, stats in decorated]
+
+
 def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
     """
     Display a dialog showing available nations and their player counts.
@@ -2661,7 +2806,7 @@ def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
         return None
     
     # Sort nations by total players (descending)
-    sorted_nations = sorted(nation_stats.values(), key=lambda x: (-x['total'], x['name']))
+    sorted_nations = sort_nation_stats(nation_stats)
     
     # Create dialog
     dialog = tk.Toplevel(parent)
@@ -2713,22 +2858,22 @@ def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
         """Populate the listbox with filtered nations"""
         listbox.delete(0, tk.END)
         nation_names_list.clear()
+        lines = []
         
         for stats in sorted_nations:
-            if stats['total'] >= min_players:
+            total, gk = stats['total'], stats['GK']
+            if total >= min_players:
                 # Format: "Nation Name          | Total: XX | GK: X | DEF: XX | MID: XX | ATT: XX | Avg: XX"
-                line = f"{stats['name']:<25} | Total: {stats['total']:>3} | GK: {stats['GK']:>2} | DEF: {stats['DEF']:>2} | MID: {stats['MID']:>2} | ATT: {stats['ATT']:>2} | Avg: {stats['avg_ovr']:>4}"
+                line = f"{stats['name']:<25} | Total: {total:>3} | GK: {gk:>2} | DEF: {stats['DEF']:>2} | MID: {stats['MID']:>2} | ATT: {stats['ATT']:>2} | Avg: {stats['avg_ovr']:>4}"
                 
                 # Add indicator for viability
-                if stats['total'] >= 23 and stats['GK'] >= 2:
-                    line = "✓ " + line
-                elif stats['total'] >= 11 and stats['GK'] >= 1:
-                    line = "○ " + line
-                else:
-                    line = "✗ " + line
+                line = _NATION_STATUS_GLYPH[classify_nation(total, gk)] + line
                 
-                listbox.insert(tk.END, line)
+                lines.append(line)
                 nation_names_list.append(stats['name'])
+
+        # Insert all rows in a single Tcl call
+        listbox.insert(tk.END, *lines)
     
     def apply_filter():
         try:
@@ -2767,12 +2912,15 @@ def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
         )
         if export_path:
             try:
+                # Classify each nation once for both the count and the batch import list
+                viable_names = [stats['name'] for stats in sorted_nations if stats['total'] >= 23 and stats['GK'] >= 2]
+
                 with open(export_path, 'w', encoding='utf-8') as f:
                     f.write("=" * 80 + "\n")
                     f.write("NATIONAL TEAM AVAILABILITY REPORT\n")
                     f.write("=" * 80 + "\n\n")
                     f.write(f"Total nations with 11+ players: {len(sorted_nations)}\n")
-                    f.write(f"Viable nations (23+ players, 2+ GK): {len([n for n in sorted_nations if n['total'] >= 23 and n['GK'] >= 2])}\n\n")
+                    f.write(f"Viable nations (23+ players, 2+ GK): {len(viable_names)}\n\n")
                     f.write("-" * 80 + "\n")
                     f.write(f"{'Nation':<25} | {'Total':>5} | {'GK':>3} | {'DEF':>3} | {'MID':>3} | {'ATT':>3} | {'Avg OVR':>7} | {'Top OVR':>7}\n")
                     f.write("-" * 80 + "\n")
@@ -2783,9 +2931,8 @@ def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
                     f.write("-" * 80 + "\n")
                     f.write("\n\nNations ready for batch import (copy these lines):\n")
                     f.write("-" * 40 + "\n")
-                    for stats in sorted_nations:
-                        if stats['total'] >= 23 and stats['GK'] >= 2:
-                            f.write(f"{stats['name']}\n")
+                    for name in viable_names:
+                        f.write(f"{name}\n")
                 
                 messagebox.showinfo("Export Complete", f"Nation list exported to:\n{export_path}")
             except Exception as e:
@@ -2825,6 +2972,118 @@ def show_nation_availability_dialog(parent, nation_stats, nation_id_map):
     return result
 
 
+def enter_team_ids_dialog(parent, nation_names):
+    """
+    Collect team IDs for several nations in one editable text dialog.
+    Each line reads "Nation,TeamID"; lines left without an ID are skipped.
+    
+    Args:
+        parent: Parent Tk window
+        nation_names (list): Nations to prefill, in order
+    
+    Returns:
+        dict | None | bool: Mapping of nation name to team ID, None if cancelled,
+        or False if the user asked to enter the IDs one by one
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title("Enter Team IDs")
+    dialog.geometry("400x500")
+    dialog.attributes('-topmost', True)
+
+    label = tk.Label(dialog, text="Enter a Team ID after each comma (Nation,TeamID) and click OK")
+    label.pack(pady=5)
+
+    frame = tk.Frame(dialog)
+    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    scrollbar = tk.Scrollbar(frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    text = tk.Text(frame, yscrollcommand=scrollbar.set)
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.config(command=text.yview)
+
+    text.insert("1.0", "\n".join(f"{name}," for name in nation_names))
+
+    result = None
+
+    def on_ok():
+        nonlocal result
+        result = text.get("1.0", tk.END)
+        dialog.destroy()
+
+    def on_one_by_one():
+        nonlocal result
+        result = False
+        dialog.destroy()
+
+    def on_cancel():
+        nonlocal result
+        result = None
+        dialog.destroy()
+
+    button_frame = tk.Frame(dialog)
+    button_frame.pack(fill=tk.X, pady=10)
+
+    tk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT, padx=10)
+    tk.Button(button_frame, text="One by one", command=on_one_by_one).pack(side=tk.RIGHT, padx=10)
+    tk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=10)
+
+    # Closing the window counts as Cancel
+    dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+
+    dialog.lift()
+    dialog.focus_force()
+    dialog.grab_set()
+    dialog.transient(parent)
+    text.focus_set()
+    parent.wait_window(dialog)
+
+    if not result:
+        return result
+
+    known_nations = set(nation_names)
+    entries = [line.split(",", 1) for line in result.splitlines() if "," in line]
+    nation_team_ids = {}
+    invalid = []
+    invalid_names = set()
+    duplicates = []
+    for name, id_str in entries:
+        name, id_str = name.strip(), id_str.strip()
+        if not id_str:
+            continue
+        if name not in known_nations:
+            invalid.append(f"{name} (unknown nation)")
+            invalid_names.add(name)
+            continue
+        if name in nation_team_ids:
+            # The first ID entered for a nation is kept
+            duplicates.append(f"{name} ({id_str})")
+            continue
+        team_id = parse_int(id_str)
+        if team_id is None:
+            invalid.append(f"{name} ({id_str})")
+            invalid_names.add(name)
+        else:
+            nation_team_ids[name] = team_id
+
+    # Nations left without an ID (blank or deleted lines) are dropped from the batch - say which
+    missing = [name for name in nation_names if name not in nation_team_ids and name not in invalid_names]
+
+    if invalid or duplicates or missing:
+        report = []
+        if invalid:
+            report.append("Skipped invalid entries:\n" + "\n".join(invalid))
+        if duplicates:
+            report.append("Skipped repeated nations (the first ID entered is kept):\n" + "\n".join(duplicates))
+        if missing:
+            report.append(f"No team ID entered for {len(missing)} nation(s), skipping:\n" + "\n".join(missing))
+            log.warning("Skipped %d nation(s) without a team ID: %s", len(missing), ", ".join(missing))
+        messagebox.showwarning("Skipped Nations", "\n\n".join(report))
+
+    return nation_team_ids
+
+
 def select_nations_dialog(parent, nation_names):
     """Create a dialog to select multiple nations"""
     print("Opening nation selection dialog")
@@ -2850,9 +3109,8 @@ def select_nations_dialog(parent, nation_names):
 
     scrollbar.config(command=listbox.yview)
 
-    # Add nations to the listbox
-    for nation in nation_names:
-        listbox.insert(tk.END, nation)
+    # Add nations to the listbox in a single Tcl call
+    listbox.insert(tk.END, *nation_names)
 
     print(f"Added {len(nation_names)} nations to selection dialog")
 
@@ -2907,15 +3165,7 @@ def select_nations_dialog(parent, nation_names):
 
     dialog.protocol("WM_DELETE_WINDOW", on_close)
 
-    # Safety timeout in case dialog is not visible
-    def check_dialog():
-        if not dialog_completed and dialog.winfo_exists():
-            print("Dialog still waiting for user input...")
-            dialog.after(5000, check_dialog)  # Check again in 5 seconds
-
-    dialog.after(5000, check_dialog)  # Initial check in 5 seconds
-
-    # Make the dialog modal
+    # Make the dialog modal (wait_window keeps processing events until it is destroyed)
     dialog.transient(parent)
     parent.wait_window(dialog)
 
@@ -2926,97 +3176,170 @@ def select_nations_dialog(parent, nation_names):
     return selected_nations
 
 
-def load_formations():
-    """Load the predefined formation data from FIFA"""
-    formations = [
-        {"id": 785, "name": "3-1-4-2", "audio_id": 1, "fullname_id": 28},
-        {"id": 848, "name": "3-4-1-2", "audio_id": 1, "fullname_id": 29},
-        {"id": 720, "name": "3-4-2-1", "audio_id": 19, "fullname_id": 21},
-        {"id": 823, "name": "3-4-3", "audio_id": 0, "fullname_id": 2},
-        {"id": 845, "name": "3-5-2", "audio_id": 1, "fullname_id": 22},
-        {"id": 733, "name": "4-1-2-1-2", "audio_id": 11, "fullname_id": 9},
-        {"id": 215, "name": "4-1-3-2", "audio_id": 12, "fullname_id": 30},
-        {"id": 834, "name": "4-1-4-1", "audio_id": 15, "fullname_id": 31},
-        {"id": 761, "name": "4-2-1-3", "audio_id": 18, "fullname_id": 27},
-        {"id": 624, "name": "4-2-2-2", "audio_id": 10, "fullname_id": 32},
-        {"id": 841, "name": "4-2-3-1", "audio_id": 14, "fullname_id": 16},
-        {"id": 755, "name": "4-2-4", "audio_id": 2, "fullname_id": 33},
-        {"id": 746, "name": "4-3-1-2", "audio_id": 9, "fullname_id": 34},
-        {"id": 604, "name": "4-3-2-1", "audio_id": 8, "fullname_id": 20},
-        {"id": 849, "name": "4-3-3", "audio_id": 6, "fullname_id": 7},
-        {"id": 656, "name": "4-4-1-1", "audio_id": 14, "fullname_id": 18},
-        {"id": 842, "name": "4-4-2", "audio_id": 10, "fullname_id": 11},
-        {"id": 808, "name": "4-5-1", "audio_id": 15, "fullname_id": 19},
-        {"id": 567, "name": "5-2-1-2", "audio_id": 4, "fullname_id": 35},
-        {"id": 846, "name": "5-2-3", "audio_id": 3, "fullname_id": 36},
-        {"id": 843, "name": "5-3-2", "audio_id": 4, "fullname_id": 24},
-        {"id": 686, "name": "5-4-1", "audio_id": 5, "fullname_id": 14},
-    ]
-
-    # Formation data from the provided file
-    formation_data = {
-        "3-1-4-2": {
-            "offset6x": "0.65", "offset5y": "0.5875", "offset10x": "0.39", "offset2x": "0.5", "defenders": "3.5",
-            "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.075",
-            "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.5", "offset7y": "0.5125", "offset0x": "0.5",
-            "offset8y": "0.5875", "attackers": "2", "offset9x": "0.6", "midfielders": "4.5", "offset5x": "0.925",
-            "offset0y": "0.0175", "offset1x": "0.675", "offset4y": "0.3375", "offset9y": "0.875", "offset1y": "0.15",
-            "pos0role": "4161", "pos6role": "21445", "pos8role": "25602", "pos4role": "17089", "pos7role": "21185",
-            "pos2role": "12737", "pos1role": "12737", "pos10role": "38275", "pos3role": "12737", "pos9role": "38341",
-            "pos5role": "25730", "position10": "26", "position6": "13", "position8": "16", "position5": "12",
-            "position2": "5", "position4": "10", "position3": "6", "position0": "0", "position9": "24",
-            "position7": "15", "position1": "4", "defensivedepth": "50", "buildupplay": "2"
-        },
-        "3-4-1-2": {
-            "offset6x": "0.35", "offset5y": "0.5125", "offset10x": "0.39", "offset2x": "0.5", "defenders": "3",
-            "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.075", "offset3x": "0.325", "offset8x": "0.5",
-            "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.925", "offset7y": "0.5875", "offset0x": "0.5",
-            "offset8y": "0.6625", "attackers": "2.5", "offset9x": "0.6", "midfielders": "4.5", "offset5x": "0.65",
-            "offset0y": "0.0175", "offset1x": "0.675", "offset4y": "0.5875", "offset9y": "0.875", "offset1y": "0.15",
-            "pos0role": "4161", "pos6role": "21314", "pos8role": "29570", "pos4role": "25602", "pos7role": "25602",
-            "pos2role": "12737", "pos1role": "12802", "pos10role": "38405", "pos3role": "12737", "pos9role": "38405",
-            "pos5role": "21314", "position10": "26", "position6": "15", "position8": "18", "position5": "13",
-            "position2": "5", "position4": "12", "position3": "6", "position0": "0", "position9": "24",
-            "position7": "16", "position1": "4", "defensivedepth": "30", "buildupplay": "3"
-        },
-        "4-3-3": {
-            "offset6x": "0.65", "offset5y": "0.3375", "offset10x": "0.075", "offset2x": "0.6731", "defenders": "4",
-            "offset2y": "0.1537", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.925",
-            "offset10y": "0.825", "offset3y": "0.15", "offset4x": "0.075", "offset7y": "0.5125", "offset0x": "0.497",
-            "offset8y": "0.825", "attackers": "3", "offset9x": "0.4995", "midfielders": "3", "offset5x": "0.5",
-            "offset0y": "0.0175", "offset1x": "0.9", "offset4y": "0.2", "offset9y": "0.875", "offset1y": "0.175",
-            "pos0role": "4161", "pos6role": "21314", "pos8role": "33794", "pos4role": "8386", "pos7role": "21314",
-            "pos2role": "12737", "pos1role": "8386", "pos10role": "33794", "pos3role": "12737", "pos9role": "38405",
-            "pos5role": "17089", "position10": "27", "position6": "13", "position8": "23", "position5": "10",
-            "position2": "4", "position4": "7", "position3": "6", "position0": "0", "position9": "25",
-            "position7": "15", "position1": "3", "defensivedepth": "50", "buildupplay": "2"
-        },
-        "4-4-2": {
-            "offset6x": "0.65", "offset5y": "0.5875", "offset10x": "0.39", "offset2x": "0.675", "defenders": "4",
-            "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.075",
-            "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.075", "offset7y": "0.5125", "offset0x": "0.5",
-            "offset8y": "0.5875", "attackers": "2", "offset9x": "0.6", "midfielders": "4", "offset5x": "0.925",
-            "offset0y": "0.0175", "offset1x": "0.925", "offset4y": "0.2", "offset9y": "0.875", "offset1y": "0.2",
-            "pos0role": "4226", "pos6role": "21381", "pos8role": "25794", "pos4role": "8513", "pos7role": "21314",
-            "pos2role": "12802", "pos1role": "8450", "pos10role": "38213", "pos3role": "12737", "pos9role": "38341",
-            "pos5role": "25794", "position10": "26", "position6": "13", "position8": "16", "position5": "12",
-            "position2": "4", "position4": "7", "position3": "6", "position0": "0", "position9": "24",
-            "position7": "15", "position1": "3", "defensivedepth": "50", "buildupplay": "3"
-        }
+# Predefined FIFA formations (id/name/audio/fullname only)
+_FORMATIONS_META = (
+    {"id": 785, "name": "3-1-4-2", "audio_id": 1, "fullname_id": 28},
+    {"id": 848, "name": "3-4-1-2", "audio_id": 1, "fullname_id": 29},
+    {"id": 720, "name": "3-4-2-1", "audio_id": 19, "fullname_id": 21},
+    {"id": 823, "name": "3-4-3", "audio_id": 0, "fullname_id": 2},
+    {"id": 845, "name": "3-5-2", "audio_id": 1, "fullname_id": 22},
+    {"id": 733, "name": "4-1-2-1-2", "audio_id": 11, "fullname_id": 9},
+    {"id": 215, "name": "4-1-3-2", "audio_id": 12, "fullname_id": 30},
+    {"id": 834, "name": "4-1-4-1", "audio_id": 15, "fullname_id": 31},
+    {"id": 761, "name": "4-2-1-3", "audio_id": 18, "fullname_id": 27},
+    {"id": 624, "name": "4-2-2-2", "audio_id": 10, "fullname_id": 32},
+    {"id": 841, "name": "4-2-3-1", "audio_id": 14, "fullname_id": 16},
+    {"id": 755, "name": "4-2-4", "audio_id": 2, "fullname_id": 33},
+    {"id": 746, "name": "4-3-1-2", "audio_id": 9, "fullname_id": 34},
+    {"id": 604, "name": "4-3-2-1", "audio_id": 8, "fullname_id": 20},
+    {"id": 849, "name": "4-3-3", "audio_id": 6, "fullname_id": 7},
+    {"id": 656, "name": "4-4-1-1", "audio_id": 14, "fullname_id": 18},
+    {"id": 842, "name": "4-4-2", "audio_id": 10, "fullname_id": 11},
+    {"id": 808, "name": "4-5-1", "audio_id": 15, "fullname_id": 19},
+    {"id": 567, "name": "5-2-1-2", "audio_id": 4, "fullname_id": 35},
+    {"id": 846, "name": "5-2-3", "audio_id": 3, "fullname_id": 36},
+    {"id": 843, "name": "5-3-2", "audio_id": 4, "fullname_id": 24},
+    {"id": 686, "name": "5-4-1", "audio_id": 5, "fullname_id": 14},
+)
+
+# Full position/role data for the formations that have it, merged in on demand by get_formation()
+_FORMATION_DATA = {
+    "3-1-4-2": {
+        "offset6x": "0.65", "offset5y": "0.5875", "offset10x": "0.39", "offset2x": "0.5", "defenders": "3.5",
+        "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.075",
+        "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.5", "offset7y": "0.5125", "offset0x": "0.5",
+        "offset8y": "0.5875", "attackers": "2", "offset9x": "0.6", "midfielders": "4.5", "offset5x": "0.925",
+        "offset0y": "0.0175", "offset1x": "0.675", "offset4y": "0.3375", "offset9y": "0.875", "offset1y": "0.15",
+        "pos0role": "4161", "pos6role": "21445", "pos8role": "25602", "pos4role": "17089", "pos7role": "21185",
+        "pos2role": "12737", "pos1role": "12737", "pos10role": "38275", "pos3role": "12737", "pos9role": "38341",
+        "pos5role": "25730", "position10": "26", "position6": "13", "position8": "16", "position5": "12",
+        "position2": "5", "position4": "10", "position3": "6", "position0": "0", "position9": "24",
+        "position7": "15", "position1": "4", "defensivedepth": "50", "buildupplay": "2"
+    },
+    "3-4-1-2": {
+        "offset6x": "0.35", "offset5y": "0.5125", "offset10x": "0.39", "offset2x": "0.5", "defenders": "3",
+        "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.075", "offset3x": "0.325", "offset8x": "0.5",
+        "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.925", "offset7y": "0.5875", "offset0x": "0.5",
+        "offset8y": "0.6625", "attackers": "2.5", "offset9x": "0.6", "midfielders": "4.5", "offset5x": "0.65",
+        "offset0y": "0.0175", "offset1x": "0.675", "offset4y": "0.5875", "offset9y": "0.875", "offset1y": "0.15",
+        "pos0role": "4161", "pos6role": "21314", "pos8role": "29570", "pos4role": "25602", "pos7role": "25602",
+        "pos2role": "12737", "pos1role": "12802", "pos10role": "38405", "pos3role": "12737", "pos9role": "38405",
+        "pos5role": "21314", "position10": "26", "position6": "15", "position8": "18", "position5": "13",
+        "position2": "5", "position4": "12", "position3": "6", "position0": "0", "position9": "24",
+        "position7": "16", "position1": "4", "defensivedepth": "30", "buildupplay": "3"
+    },
+    "4-3-3": {
+        "offset6x": "0.65", "offset5y": "0.3375", "offset10x": "0.075", "offset2x": "0.6731", "defenders": "4",
+        "offset2y": "0.1537", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.925",
+        "offset10y": "0.825", "offset3y": "0.15", "offset4x": "0.075", "offset7y": "0.5125", "offset0x": "0.497",
+        "offset8y": "0.825", "attackers": "3", "offset9x": "0.4995", "midfielders": "3", "offset5x": "0.5",
+        "offset0y": "0.0175", "offset1x": "0.9", "offset4y": "0.2", "offset9y": "0.875", "offset1y": "0.175",
+        "pos0role": "4161", "pos6role": "21314", "pos8role": "33794", "pos4role": "8386", "pos7role": "21314",
+        "pos2role": "12737", "pos1role": "8386", "pos10role": "33794", "pos3role": "12737", "pos9role": "38405",
+        "pos5role": "17089", "position10": "27", "position6": "13", "position8": "23", "position5": "10",
+        "position2": "4", "position4": "7", "position3": "6", "position0": "0", "position9": "25",
+        "position7": "15", "position1": "3", "defensivedepth": "50", "buildupplay": "2"
+    },
+    "4-4-2": {
+        "offset6x": "0.65", "offset5y": "0.5875", "offset10x": "0.39", "offset2x": "0.675", "defenders": "4",
+        "offset2y": "0.15", "offset6y": "0.5125", "offset7x": "0.35", "offset3x": "0.325", "offset8x": "0.075",
+        "offset10y": "0.875", "offset3y": "0.15", "offset4x": "0.075", "offset7y": "0.5125", "offset0x": "0.5",
+        "offset8y": "0.5875", "attackers": "2", "offset9x": "0.6", "midfielders": "4", "offset5x": "0.925",
+        "offset0y": "0.0175", "offset1x": "0.925", "offset4y": "0.2", "offset9y": "0.875", "offset1y": "0.2",
+        "pos0role": "4226", "pos6role": "21381", "pos8role": "25794", "pos4role": "8513", "pos7role": "21314",
+        "pos2role": "12802", "pos1role": "8450", "pos10role": "38213", "pos3role": "12737", "pos9role": "38341",
+        "pos5role": "25794", "position10": "26", "position6": "13", "position8": "16", "position5": "12",
+        "position2": "4", "position4": "7", "position3": "6", "position0": "0", "position9": "24",
+        "position7": "15", "position1": "3", "defensivedepth": "50", "buildupplay": "3"
     }
+}
+
+# Formation name -> position in _FORMATIONS_META
+_FORMATION_INDEX = {meta["name"]: idx for idx, meta in enumerate(_FORMATIONS_META)}
+
+# formations.txt columns in file order as (key, default); None marks the team/formation ID slots
+_FORMATION_COLUMNS = [
+    ("offset6x", "0.65"), ("offset5y", "0.3375"), ("offset10x", "0.075"), ("offset2x", "0.6731"),
+    ("defenders", "4"), ("offset2y", "0.1537"), ("offset6y", "0.5125"), ("offset7x", "0.35"),
+    ("offset3x", "0.325"), ("offset8x", "0.925"), ("offset10y", "0.825"), ("offset3y", "0.15"),
+    ("offset4x", "0.075"), ("offset7y", "0.5125"), ("offset0x", "0.497"), ("offset8y", "0.825"),
+    ("attackers", "3"), ("offset9x", "0.4995"), ("midfielders", "3"), ("offset5x", "0.5"),
+    ("offset0y", "0.0175"), ("offset1x", "0.9"), ("offset4y", "0.2"), ("offset9y", "0.875"),
+    ("offset1y", "0.175"), ("pos0role", "4161"), ("pos6role", "21314"), ("pos8role", "33794"),
+    ("pos4role", "8386"), ("pos7role", "21314"), ("pos2role", "12737"), ("pos1role", "8386"),
+    ("pos10role", "33794"), ("pos3role", "12737"), ("pos9role", "12737"), ("pos5role", "17089"),
+    ("name", "4-3-3"), ("position10", "27"), ("position6", "13"), ("offensiverating", "3"),
+    ("position8", "23"), ("position5", "10"), ("audio_id", "6"), ("team_id", None),
+    ("position2", "4"), ("formation_id", None), ("relativeformationid", "9"), ("position4", "7"),
+    ("position3", "6"), ("fullname_id", "7"), ("position0", "0"), ("position9", "25"),
+    ("position7", "15"), ("position1", "3"),
+]
+
+
+def _build_formation_row_formatter():
+    """
+    Compile a formatter for formations.txt rows from _FORMATION_COLUMNS
+
+    The generated function is a single f-string with every column spelled out, so formatting a row
+    is straight-line code instead of a loop over the column list.
+
+    Returns:
+        function: format_row(formation_data, team_id, formation_id) -> tab-separated row
+    """
+    fields = []
+    for key, default in _FORMATION_COLUMNS:
+        if key == "team_id":
+            fields.append("{team_id}")
+        elif key == "formation_id":
+            fields.append("{formation_id}")
+        else:
+            fields.append(f"{{get({key!r}, {default!r})}}")
+
+    row_template = "\t".join(fields)
+    source = (
+        "def format_row(formation_data, team_id, formation_id):\n"
+        "    get = formation_data.get\n"
+        f"    return f{row_template!r}\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["format_row"]
+
+
+_format_formation_row = _build_formation_row_formatter()
+
 
-    # Add the full formation data to each formation
-    for formation in formations:
-        name = formation["name"]
-        if name in formation_data:
-            formation.update(formation_data[name])
+@functools.lru_cache(maxsize=None)
+def get_formation(name):
+    """
+    Get the full data for a formation, merging its position/role table on first use
+
+    Args:
+        name (str): Formation name, e.g. "4-3-3"
 
-    return formations
+    Returns:
+        dict: Formation data, or None if the name is unknown
+    """
+    idx = _FORMATION_INDEX.get(name)
+    if idx is None:
+        return None
+
+    formation = dict(_FORMATIONS_META[idx])
+    formation.update(_FORMATION_DATA.get(name, {}))
+    return formation
+
+
+def load_formations():
+    """
+    Load the predefined formation list from FIFA.
+    Only the light id/name entries are returned - use get_formation() for the full data.
+    """
+    return [dict(meta) for meta in _FORMATIONS_META]
 
 
 def select_formation_dialog(parent, formations):
     """Create a dialog to select a formation with improved focus handling"""
-    print("Opening formation selection dialog")
+    log.debug("Opening formation selection dialog")
     dialog = tk.Toplevel(parent)
     dialog.title("Select Formation")
     dialog.geometry("300x400")
@@ -3048,52 +3371,54 @@ def select_formation_dialog(parent, formations):
 
     scrollbar.config(command=listbox.yview)
 
-    # Add formations to the listbox
-    for i, formation in enumerate(formations):
-        listbox.insert(tk.END, formation["name"])
-        # Pre-select the 4-3-3 formation as default
-        if formation["name"] == "4-3-3":
-            listbox.selection_set(i)
+    # Index formations by name once so the default lookups are a single probe
+    formation_names = [formation["name"] for formation in formations]
+    name_index = {name: idx for idx, name in enumerate(formation_names)}
+    default_idx = name_index.get("4-3-3")
+
+    # Add formations to the listbox in a single Tcl call
+    listbox.insert(tk.END, *formation_names)
+
+    # Pre-select the 4-3-3 formation as default
+    if default_idx is not None:
+        listbox.selection_set(default_idx)
 
-    print(f"Added {len(formations)} formations to selection dialog")
+    log.debug("Added %s formations to selection dialog", len(formations))
 
     # Variables to store the result
     selected_formation = None
 
     # Default to 4-3-3 in case dialog is closed unexpectedly
-    default_formation = next((f for f in formations if f["name"] == "4-3-3"), formations[0])
+    default_formation = get_formation(formations[default_idx or 0]["name"])
+
+    def with_original_id(formation):
+        """
+        Build the returned formation in one step: a copy (the cached formation must not be modified)
+        that also keeps its original ID. A new ID is generated when it is written to the file.
+        """
+        return {**formation, 'original_id': formation.get('id', 'unknown')}
 
     # Function to handle selection
     def on_ok():
         nonlocal selected_formation
         selected_indices = listbox.curselection()
         if selected_indices:
-            selected_index = selected_indices[0]
-            # Create a deep copy of the selected formation to avoid modifying the original
-            formation_dict = formations[selected_index].copy()
-
-            # Store its original ID but don't use it for the new formation
-            original_id = formation_dict.get('id', 'unknown')
-            formation_dict['original_id'] = original_id
-
-            # We'll generate a new ID when we write to the file
-            print(f"Selected formation: {formation_dict['name']} (original ID: {original_id})")
-            selected_formation = formation_dict
+            selected_formation = with_original_id(get_formation(formations[selected_indices[0]]["name"]))
+            log.debug("Selected formation: %s (original ID: %s)",
+                      selected_formation['name'], selected_formation['original_id'])
         else:
             # If nothing selected, default to 4-3-3
-            selected_formation = default_formation.copy()
-            original_id = selected_formation.get('id', 'unknown')
-            selected_formation['original_id'] = original_id
-            print(f"No selection made, defaulting to: {selected_formation['name']} (original ID: {original_id})")
+            selected_formation = with_original_id(default_formation)
+            log.debug("No selection made, defaulting to: %s (original ID: %s)",
+                      selected_formation['name'], selected_formation['original_id'])
         dialog.destroy()
 
     def on_cancel():
         nonlocal selected_formation
         # Default to 4-3-3 on cancel
-        selected_formation = default_formation.copy()
-        original_id = selected_formation.get('id', 'unknown')
-        selected_formation['original_id'] = original_id
-        print(f"Formation selection canceled, defaulting to: {selected_formation['name']} (original ID: {original_id})")
+        selected_formation = with_original_id(default_formation)
+        log.debug("Formation selection canceled, defaulting to: %s (original ID: %s)",
+                  selected_formation['name'], selected_formation['original_id'])
         dialog.destroy()
 
     # Handle dialog close via X button
@@ -3124,15 +3449,164 @@ def select_formation_dialog(parent, formations):
 
     # Always return a formation, even if dialog was closed unexpectedly
     if selected_formation is None:
-        selected_formation = default_formation.copy()
-        original_id = selected_formation.get('id', 'unknown')
-        selected_formation['original_id'] = original_id
-        print(f"Dialog closed abnormally, defaulting to: {selected_formation['name']} (original ID: {original_id})")
+        selected_formation = with_original_id(default_formation)
+        log.debug("Dialog closed abnormally, defaulting to: %s (original ID: %s)",
+                  selected_formation['name'], selected_formation['original_id'])
 
     return selected_formation
 
 
-def create_national_teams_from_file(file_path, input_dir, players_txt_path, nation_id_map, formations=None):
+def team_config_dialog(parent, title, formations, nation_hint=None):
+    """
+    Ask for everything needed to create one team in a single form:
+    team ID, nation (national teams) or player file (club teams), formation and optional stadium ID.
+
+    Args:
+        parent: Parent Tk window
+        title (str): Dialog title
+        formations (list): Formations to choose from (4-3-3 is preselected)
+        nation_hint (list, optional): Nation names to suggest; when given the form asks for a
+            nation instead of a player file
+
+    Returns:
+        dict: team_id, stadium_id (or None), formation, and nation or player_file - None if cancelled
+    """
+    ask_nation = nation_hint is not None
+    dialog = tk.Toplevel(parent)
+    dialog.title(title)
+    dialog.attributes('-topmost', True)
+
+    form = tk.Frame(dialog)
+    form.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def add_row(row, label_text):
+        tk.Label(form, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=3)
+        entry = tk.Entry(form, width=30)
+        entry.grid(row=row, column=1, sticky=tk.EW, pady=3)
+        return entry
+
+    team_id_entry = add_row(0, "Team ID:")
+
+    if ask_nation:
+        source_entry = add_row(1, "Nation:")
+        if nation_hint:
+            tk.Label(form, text="Popular nations:\n" + ", ".join(nation_hint) + "\n(You can type any valid nation name)",
+                     wraplength=300, justify=tk.LEFT).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=3)
+    else:
+        source_entry = add_row(1, "Player file:")
+
+        def on_browse():
+            player_file = filedialog.askopenfilename(
+                parent=dialog,
+                title="Select Player CSV or TXT File",
+                filetypes=[("CSV/TXT files", "*.csv *.txt"), ("All files", "*.*")]
+            )
+            if player_file:
+                source_entry.delete(0, tk.END)
+                source_entry.insert(0, player_file)
+
+        tk.Button(form, text="Browse...", command=on_browse).grid(row=1, column=2, padx=5)
+
+    formation_names = [formation["name"] for formation in formations]
+    formation_var = tk.StringVar(dialog, value="4-3-3" if "4-3-3" in formation_names else formation_names[0])
+    tk.Label(form, text="Formation:").grid(row=3, column=0, sticky=tk.W, pady=3)
+    tk.OptionMenu(form, formation_var, *formation_names).grid(row=3, column=1, sticky=tk.W, pady=3)
+
+    stadium_id_entry = add_row(4, "Stadium ID (optional):")
+    form.columnconfigure(1, weight=1)
+
+    result = None
+
+    def on_ok():
+        nonlocal result
+        team_id_str = team_id_entry.get().strip()
+        source = source_entry.get().strip()
+        stadium_id_str = stadium_id_entry.get().strip()
+
+        team_id = parse_int(team_id_str)
+        if team_id is None:
+            messagebox.showerror("Error", "Team ID must be a number.", parent=dialog)
+            return
+
+        if not source:
+            messagebox.showerror("Error", "Please enter a nation name." if ask_nation else "Please select a player file.",
+                                 parent=dialog)
+            return
+
+        stadium_id = parse_int(stadium_id_str)
+        if stadium_id_str and stadium_id is None:
+            messagebox.showerror("Error", "Stadium ID must be a number (or left blank).", parent=dialog)
+            return
+
+        formation = get_formation(formation_var.get())
+        result = {
+            'team_id': team_id,
+            'stadium_id': stadium_id,
+            # A copy that keeps the original ID, like select_formation_dialog() returns
+            'formation': {**formation, 'original_id': formation.get('id', 'unknown')},
+            'nation' if ask_nation else 'player_file': source,
+        }
+        dialog.destroy()
+
+    button_frame = tk.Frame(dialog)
+    button_frame.pack(fill=tk.X, pady=10)
+
+    tk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=10)
+    tk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=10)
+
+    dialog.bind('<Return>', lambda event: on_ok())
+    dialog.lift()
+    dialog.focus_force()
+    dialog.grab_set()
+    team_id_entry.focus_set()
+    parent.wait_window(dialog)
+
+    return result
+
+
+def show_team_results_dialog(parent, title, summary, results):
+    """
+    Show the outcome of an interactive session in one scrollable list
+
+    Args:
+        parent: Parent Tk window
+        title (str): Dialog title
+        summary (str): Text shown above the list
+        results (list): (team_name, success, message) tuples, in creation order
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title(title)
+    dialog.geometry("500x400")
+    dialog.attributes('-topmost', True)
+
+    tk.Label(dialog, text=summary, justify=tk.LEFT).pack(padx=10, pady=5, anchor=tk.W)
+
+    frame = tk.Frame(dialog)
+    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    scrollbar = tk.Scrollbar(frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    listbox = tk.Listbox(frame, yscrollcommand=scrollbar.set)
+    listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.config(command=listbox.yview)
+
+    # Add every result in a single Tcl call
+    listbox.insert(tk.END, *(f"{'✓' if success else '✗'} {message}" for _, success, message in results))
+
+    ok_button = tk.Button(dialog, text="OK", command=dialog.destroy)
+    ok_button.pack(pady=10)
+    dialog.bind('<Return>', lambda event: dialog.destroy())
+
+    dialog.lift()
+    dialog.focus_force()
+    dialog.grab_set()
+    ok_button.focus_set()
+    parent.wait_window(dialog)
+
+
+def create_national_teams_from_file(file_path, input_dir, players_txt_path, nation_id_map, parent,
+                                    formations=None):
     """
     Create multiple national teams from a text file where each line has a national team name and team ID
 
@@ -3141,111 +3615,128 @@ def create_national_teams_from_file(file_path, input_dir, players_txt_path, nati
         input_dir (str): Directory containing all game files
         players_txt_path (str): Path to players.txt file for national teams
         nation_id_map (dict): Mapping of nation names to nation IDs
+        parent (tk.Tk): Existing root window for the formation dialog
         formations (list, optional): List of available formations
 
     Returns:
         tuple: (success_count, total_count) - Number of teams successfully created and total attempted
     """
-    print(f"\nReading national teams from file: {file_path}")
+    log.info("Reading national teams from file: %s", file_path)
 
     # Check if the file exists
     if not os.path.exists(file_path):
-        print(f"Error: File not found: {file_path}")
+        log.error("File not found: %s", file_path)
         return 0, 0
 
-    # Variables to track teams
-    team_list = []
-    team_ids = {}
+    # Teams to create as an insertion-ordered set of (team_name, team_id), so repeated lines are only processed once
+    team_pairs = {}
+
+    # Lowercased nation names for matching, built once instead of for every unmatched line
+    lower_to_orig = {name.lower(): name for name in nation_id_map}
+    match_nation = build_nation_matcher(nation_id_map)
 
     # Read the file line by line
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
+        with open(file_path, 'r', encoding='utf-8', newline='', buffering=1024 * 1024) as file:
+            # csv.reader tokenizes each line in C
+            reader = csv.reader(file)
+            for row in reader:
+                line_num = reader.line_num
+                first_field = row[0].strip() if row else ''
 
                 # Skip empty lines or comments
-                if not line or line.startswith('#'):
+                if (len(row) <= 1 and not first_field) or first_field.startswith('#'):
                     continue
 
                 # Parse the line to get team name and ID
-                parts = line.split(',')
-                if len(parts) != 2:
-                    print(f"Warning: Invalid format at line {line_num}: {line}")
-                    print("Expected format: NationName,TeamID")
+                if len(row) != 2:
+                    log.warning("Invalid format at line %s: %s", line_num, ','.join(row).strip())
+                    log.warning("Expected format: NationName,TeamID")
                     continue
 
-                team_name = parts[0].strip()
-                team_id_str = parts[1].strip()
+                team_name = first_field
+                team_id_str = row[1].strip()
 
                 # Validate team ID
-                try:
-                    team_id = int(team_id_str)
-                except ValueError:
-                    print(f"Warning: Invalid team ID at line {line_num}: {team_id_str}")
+                team_id = parse_int(team_id_str)
+                if team_id is None:
+                    log.warning("Invalid team ID at line %s: %s", line_num, team_id_str)
                     continue
 
                 # Check if the nation exists in our mapping
                 if team_name not in nation_id_map:
-                    # Try to find a partial match
-                    matching_nations = [n for n in nation_id_map.keys() if team_name.lower() in n.lower()]
-                    if matching_nations:
+                    # Try a case-insensitive exact match, then a partial match (first one wins)
+                    matched_name = lower_to_orig.get(team_name.lower())
+                    if matched_name is None:
+                        matched_name = next(iter(match_nation(team_name)), None)
+                    if matched_name:
                         original_name = team_name
-                        team_name = matching_nations[0]
-                        print(f"Note: Matched '{original_name}' to '{team_name}'")
+                        team_name = matched_name
+                        log.debug("Matched '%s' to '%s'", original_name, team_name)
                     else:
-                        print(f"Warning: Nation '{team_name}' not found in nation ID mapping. Skipping.")
+                        log.warning("Nation '%s' not found in nation ID mapping. Skipping.", team_name)
                         continue
 
                 # Add to our list
-                team_list.append(team_name)
-                team_ids[team_name] = team_id
-                print(f"Added team: {team_name} (ID: {team_id})")
+                if (team_name, team_id) in team_pairs:
+                    log.debug("Skipping duplicate entry at line %s: %s (ID: %s)", line_num, team_name, team_id)
+                    continue
+                team_pairs[(team_name, team_id)] = None
+                log.debug("Added team: %s (ID: %s)", team_name, team_id)
 
-        print(f"Found {len(team_list)} valid teams in the file")
+        log.info("Found %s valid teams in the file", len(team_pairs))
 
-        if not team_list:
-            print("No valid teams found in the file. Nothing to process.")
+        if not team_pairs:
+            log.info("No valid teams found in the file. Nothing to process.")
             return 0, 0
 
         # Ask user to select a formation (same for all teams)
         if formations:
             # Get the default 4-3-3 formation
-            default_formation = next((f for f in formations if f["name"] == "4-3-3"), formations[0])
-            selected_formation = select_formation_dialog(tk.Tk(), formations)
+            default_formation = get_formation("4-3-3") or get_formation(formations[0]["name"])
+            selected_formation = select_formation_dialog(parent, formations)
             if not selected_formation:
                 selected_formation = default_formation
         else:
             selected_formation = None
 
-        # Process each team
+        # Read players.txt once for the whole batch instead of once per team
+        players_by_nation = load_players_grouped_by_nation(players_txt_path, nation_id_map,
+                                                           {team_name for team_name, _ in team_pairs})
+
+        # Start from freshly scanned headers and IDs
+        clear_file_caches()
+
+        # Process each team, reusing one appender for the whole file
         success_count = 0
-        for team_name in team_list:
-            team_id = team_ids[team_name]
+        appender = TeamAppender(None, None, 78, is_national_team=True)
+        for team_name, team_id in team_pairs:
             nation_id = nation_id_map.get(team_name)
 
-            print(f"\nProcessing national team: {team_name} (ID: {team_id}, Nation ID: {nation_id})")
+            log.debug("Processing national team: %s (ID: %s, Nation ID: %s)", team_name, team_id, nation_id)
 
-            # Create a team appender for this national team
-            appender = TeamAppender(team_name, team_id, 78, nation_id, is_national_team=True)
+            appender.reset(team_name, team_id, 78, nation_id, is_national_team=True)
 
-            # Load player data from players.txt
-            if not appender.load_player_data(players_txt_path):
-                print(f"Failed to load player data for {team_name}. Skipping.")
+            # Load this nation's players from the preloaded table
+            if not appender.load_player_data_from_rows(players_by_nation.get(team_name, [])):
+                log.error("Failed to load player data for %s. Skipping.", team_name)
                 continue
 
             # Process all files
             if appender.process_files(input_dir, selected_formation):
                 success_count += 1
-                print(f"Team {team_name} processed successfully.")
+                log.info("Team %s processed successfully.", team_name)
             else:
-                print(f"Some errors occurred while processing team {team_name}.")
+                log.error("Some errors occurred while processing team %s.", team_name)
 
-        return success_count, len(team_list)
+        return success_count, len(team_pairs)
 
     except Exception as e:
-        print(f"Error processing teams file: {str(e)}")
+        log.error("Error processing teams file: %s", e)
         traceback.print_exc()
         return 0, 0
+    finally:
+        clear_file_caches()
 
 
 # Add to TeamAppender class:
@@ -3358,6 +3849,9 @@ def append_to_formations_file(self, file_path, selected_formation=None):
 
 
 def main():
+    # Per-team progress is logged at DEBUG; show one status line per team by default
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Create a Tkinter root window (will not be shown)
     root = tk.Tk()
     root.withdraw()  # Hide the main window
@@ -3402,6 +3896,9 @@ def main():
             root.destroy()
             return
 
+        # Partial nation name matching shared by every prompt below
+        match_nation = build_nation_matcher(nation_id_map)
+
         # Ask user to select players.txt file
         messagebox.showinfo("National Team Creator", "Please select the players.txt file.")
 
@@ -3426,8 +3923,9 @@ def main():
             root.destroy()
             return
 
-        # Load formations data
+        # Load formations data; the 4-3-3 fallback is looked up once and reused by every prompt below
         formations = load_formations()
+        default_formation = get_formation("4-3-3")
 
         # Ask which mode to use for national team creation - use messagebox which works with hidden root
         scan_first = messagebox.askyesno(
@@ -3465,7 +3963,7 @@ def main():
                 return
             
             # Sort nations by total players
-            sorted_nations = sorted(nation_stats.values(), key=lambda x: (-x['total'], x['name']))
+            sorted_nations = sort_nation_stats(nation_stats)
             
             # Print results to console
             print("\n" + "="*80)
@@ -3476,19 +3974,31 @@ def main():
             
             viable_nations = []
             possible_nations = []
+
+            # The columns up to ATT are the same on the console and in the export,
+            # so format them once per nation and share them between both outputs
+            format_row_prefix = "{name:<25} | {total:>5} | {GK:>3} | {DEF:>3} | {MID:>3} | {ATT:>3} | ".format_map
+            row_prefixes = []
+            console_rows = []
             
             for stats in sorted_nations:
-                status = ""
-                if stats['total'] >= 23 and stats['GK'] >= 2:
-                    status = "✓ VIABLE"
-                    viable_nations.append(stats['name'])
-                elif stats['total'] >= 11 and stats['GK'] >= 1:
-                    status = "○ POSSIBLE"
-                    possible_nations.append(stats['name'])
-                else:
-                    status = "✗ NEEDS MORE"
+                name = stats['name']
+                total = stats['total']
+                gk = stats['GK']
+
+                status_key = classify_nation(total, gk)
+                status = _NATION_STATUS[status_key]
+                if status_key == "viable":
+                    viable_nations.append(name)
+                elif status_key == "possible":
+                    possible_nations.append(name)
                 
-                print(f"{stats['name']:<25} | {stats['total']:>5} | {stats['GK']:>3} | {stats['DEF']:>3} | {stats['MID']:>3} | {stats['ATT']:>3} | {stats['avg_ovr']:>5} | {status}")
+                row_prefix = format_row_prefix(stats)
+                row_prefixes.append(row_prefix)
+                console_rows.append(f"{row_prefix}{stats['avg_ovr']:>5} | {status}")
+            
+            if console_rows:
+                print("\n".join(console_rows))
             
             print("-"*80)
             print(f"\nSUMMARY: {len(viable_nations)} viable nations, {len(possible_nations)} possible nations")
@@ -3529,29 +4039,31 @@ def main():
                         )
                         if export_path:
                             try:
+                                # Build the whole report first and write it in one call
+                                rule80 = "-" * 80 + "\n"
+                                rule40 = "-" * 40 + "\n"
+                                report = [
+                                    "=" * 80 + "\n",
+                                    "NATIONAL TEAM AVAILABILITY REPORT\n",
+                                    "=" * 80 + "\n\n",
+                                    f"Total nations with 11+ players: {len(sorted_nations)}\n",
+                                    f"Viable nations (23+ players, 2+ GK): {len(viable_nations)}\n\n",
+                                    rule80,
+                                    f"{'Nation':<25} | {'Total':>5} | {'GK':>3} | {'DEF':>3} | {'MID':>3} | {'ATT':>3} | {'Avg OVR':>7}\n",
+                                    rule80,
+                                    "".join(f"{row_prefix}{stats['avg_ovr']:>7}\n"
+                                            for row_prefix, stats in zip(row_prefixes, sorted_nations)),
+                                    rule80,
+                                    "\n\nVIABLE NATIONS (ready for batch import):\n",
+                                    rule40,
+                                    "".join(f"{name}\n" for name in viable_nations),
+                                    "\n\nPOSSIBLE NATIONS (11-22 players):\n",
+                                    rule40,
+                                    "".join(f"{name}\n" for name in possible_nations),
+                                ]
+
                                 with open(export_path, 'w', encoding='utf-8') as f:
-                                    f.write("=" * 80 + "\n")
-                                    f.write("NATIONAL TEAM AVAILABILITY REPORT\n")
-                                    f.write("=" * 80 + "\n\n")
-                                    f.write(f"Total nations with 11+ players: {len(sorted_nations)}\n")
-                                    f.write(f"Viable nations (23+ players, 2+ GK): {len(viable_nations)}\n\n")
-                                    f.write("-" * 80 + "\n")
-                                    f.write(f"{'Nation':<25} | {'Total':>5} | {'GK':>3} | {'DEF':>3} | {'MID':>3} | {'ATT':>3} | {'Avg OVR':>7}\n")
-                                    f.write("-" * 80 + "\n")
-                                    
-                                    for stats in sorted_nations:
-                                        f.write(f"{stats['name']:<25} | {stats['total']:>5} | {stats['GK']:>3} | {stats['DEF']:>3} | {stats['MID']:>3} | {stats['ATT']:>3} | {stats['avg_ovr']:>7}\n")
-                                    
-                                    f.write("-" * 80 + "\n")
-                                    f.write("\n\nVIABLE NATIONS (ready for batch import):\n")
-                                    f.write("-" * 40 + "\n")
-                                    for name in viable_nations:
-                                        f.write(f"{name}\n")
-                                    
-                                    f.write("\n\nPOSSIBLE NATIONS (11-22 players):\n")
-                                    f.write("-" * 40 + "\n")
-                                    for name in possible_nations:
-                                        f.write(f"{name}\n")
+                                    f.write("".join(report))
                                 
                                 messagebox.showinfo("Export Complete", f"Nation list exported to:\n{export_path}")
                             except Exception as e:
@@ -3587,7 +4099,7 @@ def main():
                                 valid_nations.append(nation)
                             else:
                                 # Try partial match
-                                matches = [n for n in nation_id_map.keys() if nation.lower() in n.lower()]
+                                matches = match_nation(nation)
                                 if matches:
                                     valid_nations.append(matches[0])
                                     print(f"Matched '{nation}' to '{matches[0]}'")
@@ -3624,46 +4136,54 @@ def main():
                 selected_formation = select_formation_dialog(root, formations)
                 root.withdraw()
                 if not selected_formation:
-                    selected_formation = next((f for f in formations if f["name"] == "4-3-3"), None)
+                    selected_formation = default_formation
                     print(f"No formation selected, defaulting to 4-3-3")
                 else:
                     print(f"Using formation {selected_formation['name']} for all teams")
             
-            # Now ask for team IDs for each nation individually
-            messagebox.showinfo("Team IDs", 
-                f"You will now enter a unique Team ID for each of the {len(selected_nations)} nations.\n\n" +
-                "Press Cancel at any time to skip remaining nations.")
+            # Collect all team IDs in one dialog, falling back to one prompt per nation
+            root.deiconify()
+            root.lift()
+            nation_team_ids = enter_team_ids_dialog(root, selected_nations)
+            root.withdraw()
+            
+            if nation_team_ids is None:
+                root.destroy()
+                return
             
-            # Collect team IDs for each nation
-            nation_team_ids = {}
-            for nation_name in selected_nations:
-                root.deiconify()
-                root.lift()
-                team_id_str = simpledialog.askstring("National Team Creator",
-                                                     f"Enter Team ID for {nation_name}:\n\n" +
-                                                     f"(Nation {len(nation_team_ids) + 1} of {len(selected_nations)})",
-                                                     parent=root)
-                root.withdraw()
+            if nation_team_ids is False:
+                messagebox.showinfo("Team IDs", 
+                    f"You will now enter a unique Team ID for each of the {len(selected_nations)} nations.\n\n" +
+                    "Press Cancel at any time to skip remaining nations.")
                 
-                if not team_id_str:
-                    # User cancelled - ask if they want to proceed with what they have
-                    if nation_team_ids:
-                        proceed = messagebox.askyesno("Continue?", 
-                            f"You've entered {len(nation_team_ids)} team IDs.\n" +
-                            "Do you want to create those teams now?\n\n" +
-                            "Yes - Create the teams entered so far\n" +
-                            "No - Cancel everything")
-                        if proceed:
-                            break
-                    root.destroy()
-                    return
+                nation_team_ids = {}
+                for nation_name in selected_nations:
+                    root.deiconify()
+                    root.lift()
+                    team_id_str = simpledialog.askstring("National Team Creator",
+                                                         f"Enter Team ID for {nation_name}:\n\n" +
+                                                         f"(Nation {len(nation_team_ids) + 1} of {len(selected_nations)})",
+                                                         parent=root)
+                    root.withdraw()
                 
-                try:
-                    team_id = int(team_id_str)
+                    if not team_id_str:
+                        # User cancelled - ask if they want to proceed with what they have
+                        if nation_team_ids:
+                            proceed = messagebox.askyesno("Continue?", 
+                                f"You've entered {len(nation_team_ids)} team IDs.\n" +
+                                "Do you want to create those teams now?\n\n" +
+                                "Yes - Create the teams entered so far\n" +
+                                "No - Cancel everything")
+                            if proceed:
+                                break
+                        root.destroy()
+                        return
+                
+                    team_id = parse_int(team_id_str)
+                    if team_id is None:
+                        messagebox.showerror("Error", f"Invalid team ID for {nation_name}. Skipping this nation.")
+                        continue
                     nation_team_ids[nation_name] = team_id
-                except ValueError:
-                    messagebox.showerror("Error", f"Invalid team ID for {nation_name}. Skipping this nation.")
-                    continue
             
             if not nation_team_ids:
                 messagebox.showinfo("Cancelled", "No team IDs entered.")
@@ -3675,33 +4195,41 @@ def main():
             existing_team_ids = get_existing_team_ids(teams_txt_path)
             
             # Confirmation loop - allow editing until user confirms or cancels
+            # Duplicate checks only need redoing after EDIT or LOAD change the IDs.
+            # Those only ever change IDs, never which nations are in the batch.
+            nations_list = list(nation_team_ids)
+            ids_changed = True
             while True:
-                # Check for duplicate team IDs
-                duplicates = []
-                for nation_name, team_id in nation_team_ids.items():
-                    if team_id in existing_team_ids:
-                        duplicates.append(f"  ⚠️ {nation_name}: {team_id} (already used by '{existing_team_ids[team_id]}')")
-                
-                # Check for duplicate IDs within the current batch
-                id_counts = {}
-                for nation_name, team_id in nation_team_ids.items():
-                    if team_id in id_counts:
-                        id_counts[team_id].append(nation_name)
-                    else:
-                        id_counts[team_id] = [nation_name]
-                
-                internal_duplicates = []
-                for team_id, nations in id_counts.items():
-                    if len(nations) > 1:
-                        internal_duplicates.append(f"  ⚠️ ID {team_id} used by: {', '.join(nations)}")
+                if ids_changed:
+                    items = list(nation_team_ids.items())
+
+                    # IDs in this batch that already exist in teams.txt (one set intersection)
+                    dup_set = existing_team_ids.keys() & set(nation_team_ids.values())
+
+                    # Check for duplicate team IDs
+                    duplicates = []
+                    for nation_name, team_id in items:
+                        if team_id in dup_set:
+                            duplicates.append(f"  ⚠️ {nation_name}: {team_id} (already used by '{existing_team_ids[team_id]}')")
+
+                    # Check for duplicate IDs within the current batch (tally in one pass, then name only the repeats)
+                    id_counts = collections.Counter(nation_team_ids.values())
+                    nations_by_id = {}
+                    for nation_name, team_id in items:
+                        if id_counts[team_id] > 1:
+                            nations_by_id.setdefault(team_id, []).append(nation_name)
+
+                    internal_duplicates = [f"  ⚠️ ID {team_id} used by: {', '.join(nations)}"
+                                           for team_id, nations in nations_by_id.items()]
+                    ids_changed = False
                 
                 # Show confirmation before creating teams
                 print("\n" + "="*60)
                 print("REVIEW: TEAMS TO BE CREATED")
                 print("="*60)
-                for idx, (nation_name, team_id) in enumerate(nation_team_ids.items(), 1):
+                for idx, (nation_name, team_id) in enumerate(items, 1):
                     nation_id = nation_id_map.get(nation_name, "?")
-                    warning = " ⚠️ DUPLICATE!" if team_id in existing_team_ids else ""
+                    warning = " ⚠️ DUPLICATE!" if team_id in dup_set else ""
                     print(f"  {idx}. {nation_name:<25} -> Team ID: {team_id} (Nation ID: {nation_id}){warning}")
                 
                 if duplicates:
@@ -3717,10 +4245,9 @@ def main():
                 print("="*60 + "\n")
                 
                 # Build confirmation message
-                if len(nation_team_ids) <= 10:
-                    confirm_list = "\n".join([f"{idx}. {name}: {tid}" for idx, (name, tid) in enumerate(nation_team_ids.items(), 1)])
+                if len(items) <= 10:
+                    confirm_list = "\n".join([f"{idx}. {name}: {tid}" for idx, (name, tid) in enumerate(items, 1)])
                 else:
-                    items = list(nation_team_ids.items())
                     confirm_list = "\n".join([f"{idx}. {name}: {tid}" for idx, (name, tid) in enumerate(items[:8], 1)])
                     confirm_list += f"\n... ({len(items) - 10} more) ...\n"
                     confirm_list += "\n".join([f"{idx}. {name}: {tid}" for idx, (name, tid) in enumerate(items[-2:], len(items) - 1)])
@@ -3794,6 +4321,7 @@ def main():
                             for name, tid in loaded_ids.items():
                                 if name in nation_team_ids:
                                     nation_team_ids[name] = tid
+                                    ids_changed = True
                                     print(f"Updated {name} -> {tid}")
                             messagebox.showinfo("Loaded", f"Loaded {len(loaded_ids)} team ID mappings.")
                         else:
@@ -3801,12 +4329,11 @@ def main():
                             
                 elif action in ['P', 'PREVIEW']:
                     # Preview starting XI for a nation
-                    nations_list = list(nation_team_ids.keys())
-                    preview_prompt = "Enter number or nation name to preview:\n\n"
-                    for idx, name in enumerate(nations_list[:15], 1):
-                        preview_prompt += f"{idx}. {name}\n"
+                    prompt_lines = ["Enter number or nation name to preview:", ""]
+                    prompt_lines.extend(f"{idx}. {name}" for idx, name in enumerate(nations_list[:15], 1))
                     if len(nations_list) > 15:
-                        preview_prompt += f"... and {len(nations_list) - 15} more\n"
+                        prompt_lines.append(f"... and {len(nations_list) - 15} more")
+                    preview_prompt = "\n".join(prompt_lines) + "\n"
                     
                     root.deiconify()
                     root.lift()
@@ -3824,15 +4351,18 @@ def main():
                             if 1 <= idx <= len(nations_list):
                                 nation_to_preview = nations_list[idx - 1]
                         else:
+                            query = preview_choice.lower()
                             for name in nations_list:
-                                if preview_choice.lower() in name.lower():
+                                if query in name.lower():
                                     nation_to_preview = name
                                     break
                         
                         if nation_to_preview:
                             nation_id = nation_id_map.get(nation_to_preview)
                             if nation_id:
-                                preview = get_starting_xi_preview(players_txt_path, nation_id, nation_to_preview)
+                                preview = cached_starting_xi_preview(players_txt_path, nation_id,
+                                                                     os.path.getmtime(players_txt_path),
+                                                                     nation_to_preview)
                                 print(preview)
                                 messagebox.showinfo(f"Starting XI: {nation_to_preview}", 
                                     f"Check the console for the full starting XI preview!\n\n" +
@@ -3844,13 +4374,13 @@ def main():
                 
                 elif action in ['E', 'EDIT']:
                     # Show edit dialog
-                    nations_list = list(nation_team_ids.keys())
-                    edit_prompt = "Enter the number or nation name to edit:\n\n"
-                    for idx, name in enumerate(nations_list[:15], 1):
-                        warning = " ⚠️" if nation_team_ids[name] in existing_team_ids else ""
-                        edit_prompt += f"{idx}. {name}: {nation_team_ids[name]}{warning}\n"
+                    prompt_lines = ["Enter the number or nation name to edit:", ""]
+                    prompt_lines.extend(
+                        f"{idx}. {name}: {nation_team_ids[name]}{' ⚠️' if nation_team_ids[name] in dup_set else ''}"
+                        for idx, name in enumerate(nations_list[:15], 1))
                     if len(nations_list) > 15:
-                        edit_prompt += f"... and {len(nations_list) - 15} more (check console)\n"
+                        prompt_lines.append(f"... and {len(nations_list) - 15} more (check console)")
+                    edit_prompt = "\n".join(prompt_lines) + "\n"
                     
                     root.deiconify()
                     root.lift()
@@ -3868,8 +4398,9 @@ def main():
                             if 1 <= idx <= len(nations_list):
                                 nation_to_edit = nations_list[idx - 1]
                         else:
+                            query = edit_choice.lower()
                             for name in nations_list:
-                                if edit_choice.lower() in name.lower():
+                                if query in name.lower():
                                     nation_to_edit = name
                                     break
                         
@@ -3883,14 +4414,15 @@ def main():
                             root.withdraw()
                             
                             if new_id_str:
-                                try:
-                                    new_id = int(new_id_str)
+                                new_id = parse_int(new_id_str)
+                                if new_id is None:
+                                    messagebox.showerror("Error", "Invalid team ID. Must be a number.")
+                                else:
                                     old_id = nation_team_ids[nation_to_edit]
                                     nation_team_ids[nation_to_edit] = new_id
+                                    ids_changed = True
                                     print(f"Updated {nation_to_edit}: {old_id} -> {new_id}")
                                     messagebox.showinfo("Updated", f"{nation_to_edit} Team ID changed:\n{old_id} → {new_id}")
-                                except ValueError:
-                                    messagebox.showerror("Error", "Invalid team ID. Must be a number.")
                         else:
                             messagebox.showerror("Error", f"Could not find nation: {edit_choice}")
                 else:
@@ -3900,35 +4432,57 @@ def main():
             league_id = 78
             success_count = 0
             created_teams = []
-            
-            for nation_name, team_id in nation_team_ids.items():
+
+            # Collect the per-team status lines and write them out once the batch is done
+            status_report = io.StringIO()
+
+            # Pick every team's formation up front (random ones in a single draw) so the squad building below gets fixed inputs
+            if selected_formation is None:
+                formation_picks = [get_formation(f["name"]) for f in random.choices(formations, k=len(nation_team_ids))]
+            else:
+                formation_picks = [selected_formation] * len(nation_team_ids)
+
+            jobs = []
+            for (nation_name, team_id), team_formation in zip(nation_team_ids.items(), formation_picks):
                 nation_id = nation_id_map.get(nation_name)
                 if not nation_id:
-                    print(f"✗ Could not find nation ID for {nation_name}. Skipping.")
+                    status_report.write(f"✗ Could not find nation ID for {nation_name}. Skipping.\n")
                     continue
-                
-                # Pick formation - random if not set, otherwise use selected
-                if selected_formation is None:
-                    team_formation = random.choice(formations)
-                    print(f"\nProcessing: {nation_name} (Team ID: {team_id}, Nation ID: {nation_id}, Formation: {team_formation['name']})")
-                else:
-                    team_formation = selected_formation
-                    print(f"\nProcessing: {nation_name} (Team ID: {team_id}, Nation ID: {nation_id})")
-                
-                appender = TeamAppender(nation_name, team_id, league_id, nation_id, is_national_team=True)
-                
-                if appender.load_player_data(players_txt_path):
+                jobs.append((nation_name, team_id, nation_id, team_formation))
+
+            # players.txt is parsed once here; each nation's squad is built from its own rows only.
+            # Building a squad takes milliseconds, so this runs serially rather than in worker processes.
+            players_by_nation = load_players_grouped_by_nation(players_txt_path, nation_id_map,
+                                                               [nation_name for nation_name, _, _, _ in jobs])
+            build_jobs = [(nation_name, team_id, league_id, nation_id, players_by_nation.get(nation_name, []))
+                          for nation_name, team_id, nation_id, _ in jobs]
+            appenders = [_build_national_team(job) for job in build_jobs]
+
+            # The formation only shows up in the messages when it differs per team; pick the
+            # formatters once instead of re-checking selected_formation for every team
+            if selected_formation is None:
+                format_processing = "\nProcessing: {0} (Team ID: {1}, Nation ID: {2}, Formation: {3})\n".format
+                format_created = "{0} (ID: {1}, {3})".format
+            else:
+                format_processing = "\nProcessing: {0} (Team ID: {1}, Nation ID: {2})\n".format
+                format_created = "{0} (ID: {1})".format
+
+            # Write the game files one team at a time, in order, so new IDs stay sequential
+            for (nation_name, team_id, nation_id, team_formation), appender in zip(jobs, appenders):
+                formation_name = team_formation['name']
+                status_report.write(format_processing(nation_name, team_id, nation_id, formation_name))
+
+                if appender:
                     if appender.process_files(input_dir, team_formation):
                         success_count += 1
-                        if selected_formation is None:
-                            created_teams.append(f"{nation_name} (ID: {team_id}, {team_formation['name']})")
-                        else:
-                            created_teams.append(f"{nation_name} (ID: {team_id})")
-                        print(f"✓ {nation_name} created successfully!")
+                        created_teams.append(format_created(nation_name, team_id, nation_id, formation_name))
+                        status_report.write(f"✓ {nation_name} created successfully!\n")
                     else:
-                        print(f"✗ Failed to process files for {nation_name}")
+                        status_report.write(f"✗ Failed to process files for {nation_name}\n")
                 else:
-                    print(f"✗ Failed to load players for {nation_name}")
+                    status_report.write(f"✗ Failed to load players for {nation_name}\n")
+
+            sys.stdout.write(status_report.getvalue())
             
             # Show results
             if success_count > 0:
@@ -3966,7 +4520,7 @@ def main():
 
             # Process the teams file
             success_count, total_count = create_national_teams_from_file(
-                teams_file_path, input_dir, players_txt_path, nation_id_map, formations)
+                teams_file_path, input_dir, players_txt_path, nation_id_map, root, formations)
 
             # Show results
             if success_count > 0:
@@ -3982,52 +4536,39 @@ def main():
         elif national_team_mode == 'interactive':
             # Sequential team creation loop (original code)
             continue_creating = True
-            while continue_creating:
-                # Get team ID for each team
-                root.deiconify()
-                root.lift()
-                team_id_str = simpledialog.askstring("National Team Creator",
-                                                     "Enter the team ID for this national team:",
-                                                     parent=root)
-                root.withdraw()
-                if not team_id_str:
-                    messagebox.showinfo("Cancelled", "No team ID entered. Exiting.")
-                    root.destroy()
-                    return
-                try:
-                    current_team_id = int(team_id_str)
-                except ValueError:
-                    messagebox.showerror("Error", "Team ID must be a number.")
-                    continue  # Ask for team ID again
 
-                # Create a string with popular nations
-                popular_nations = ["England", "France", "Germany", "Spain", "Italy", "Brazil", "Argentina",
-                                   "Portugal", "Belgium", "Holland", "Mexico", "United States", "Japan",
-                                   "Australia", "Egypt", "Nigeria", "South Africa"]
+            # One appender for the whole session; reset() gives it each team's details
+            appender = TeamAppender(None, None, 78, is_national_team=True)
+
+            # (team_name, success, message) for every team, shown together once the session ends
+            results = []
 
-                # Filter to include only nations in our mapping
-                popular_nations = [n for n in popular_nations if n in nation_id_map]
+            # Popular nations to suggest, filtered to the ones in our mapping
+            popular_nations = [n for n in ["England", "France", "Germany", "Spain", "Italy", "Brazil", "Argentina",
+                                           "Portugal", "Belgium", "Holland", "Mexico", "United States", "Japan",
+                                           "Australia", "Egypt", "Nigeria", "South Africa"]
+                               if n in nation_id_map]
 
-                # Nation selection dialog
+            while continue_creating:
+                # Team ID, nation, formation and stadium are all entered in one form
                 root.deiconify()
                 root.lift()
-                selected_nation = simpledialog.askstring(
-                    "Select Nation",
-                    f"Type a nation name (team ID: {current_team_id}):\n\n" +
-                    "Popular nations:\n" + "\n".join(popular_nations) +
-                    "\n\n(You can type any valid nation name)",
-                    parent=root)
+                config = team_config_dialog(root, "National Team Creator", formations, nation_hint=popular_nations)
                 root.withdraw()
+                if not config:
+                    if not results:
+                        messagebox.showinfo("Cancelled", "No team details entered. Exiting.")
+                    break
 
-                if not selected_nation:
-                    messagebox.showinfo("Cancelled", "No nation selected. Exiting.")
-                    root.destroy()
-                    return
+                current_team_id = config['team_id']
+                selected_nation = config['nation']
+                selected_formation = config['formation']
+                stadium_id = config['stadium_id']
 
                 # Check if the entered nation is valid
                 if selected_nation not in nation_id_map:
                     # Try to find a partial match
-                    matching_nations = [n for n in nation_id_map.keys() if selected_nation.lower() in n.lower()]
+                    matching_nations = match_nation(selected_nation)
                     if matching_nations:
                         selected_nation = matching_nations[0]
                         print(f"Matched partial entry to: {selected_nation}")
@@ -4035,32 +4576,9 @@ def main():
                         messagebox.showerror("Error", f"'{selected_nation}' is not a valid nation name.")
                         continue  # Skip to next iteration
 
-                # Ask user to select a formation
-                root.deiconify()
-                root.lift()
-                selected_formation = select_formation_dialog(root, formations)
-                root.withdraw()
-                if not selected_formation:
-                    # User cancelled or didn't select a formation
-                    selected_formation = next((f for f in formations if f["name"] == "4-3-3"), None)
-                    print(f"No formation selected, defaulting to 4-3-3")
-
-                # Ask for stadium ID (optional)
-                root.deiconify()
-                root.lift()
-                stadium_id_str = simpledialog.askstring("National Team Creator",
-                                                        "Enter the stadium ID for this team (or leave blank to skip):",
-                                                        parent=root)
-                root.withdraw()
-                stadium_id = None
-                if stadium_id_str:
-                    try:
-                        stadium_id = int(stadium_id_str)
-                    except ValueError:
-                        messagebox.showwarning("Warning", "Invalid stadium ID. Stadium linking will be skipped.")
-
                 selected_nations = [selected_nation]
-                print(f"Selected nation: {selected_nations[0]} (ID: {nation_id_map[selected_nations[0]]})")
+                nation_id = nation_id_map[selected_nation]
+                print(f"Selected nation: {selected_nation} (ID: {nation_id})")
                 print(f"Selected formation: {selected_formation['name']}")
                 if stadium_id:
                     print(f"Stadium ID: {stadium_id}")
@@ -4069,9 +4587,9 @@ def main():
                 league_id = 78  # Always 78 for national teams
                 success_count = 0
 
-                # Create a team appender for this national team
-                appender = TeamAppender(selected_nation, current_team_id, league_id,
-                                        nation_id_map[selected_nation], is_national_team=True, stadium_id=stadium_id)
+                # Point the session's appender at this national team
+                appender.reset(selected_nation, current_team_id, league_id,
+                               nation_id, is_national_team=True, stadium_id=stadium_id)
 
                 # Load player data and process files
                 if appender.load_player_data(players_txt_path):
@@ -4080,16 +4598,19 @@ def main():
                 else:
                     print(f"Failed to load player data for {selected_nation}.")
 
-                # Show results
+                # Record the result and ask about the next team in the same prompt
                 if success_count == 1:
-                    messagebox.showinfo("Success",
-                                        f"{selected_nation} national team created with ID {current_team_id} using {selected_formation['name']} formation!")
+                    result = f"{selected_nation} national team created with ID {current_team_id} using {selected_formation['name']} formation!"
                 else:
-                    messagebox.showwarning("Error",
-                                           f"Failed to create the {selected_nation} national team. Check the console for details.")
+                    result = f"Failed to create the {selected_nation} national team. Check the console for details."
+                results.append((selected_nation, success_count == 1, result))
+
+                continue_creating = messagebox.askyesno("Continue?", f"{result}\n\nCreate another national team?")
 
-                # Ask if user wants to create another team
-                continue_creating = messagebox.askyesno("Continue?", "Create another national team?")
+            if results:
+                created = sum(success for _, success, _ in results)
+                show_team_results_dialog(root, "Final Results",
+                                         f"Created {created} out of {len(results)} national teams.", results)
 
         root.destroy()
         return
@@ -4098,8 +4619,9 @@ def main():
         # Regular club team creation (existing code)
         print("Selected club team option")
 
-        # Load formations data
+        # Load formations data; the 4-3-3 fallback is looked up once and reused by every prompt below
         formations = load_formations()
+        default_formation = get_formation("4-3-3")
 
         # Get league ID (single league for all teams)
         root.deiconify()
@@ -4111,9 +4633,8 @@ def main():
             messagebox.showerror("Error", "League ID is required.")
             root.destroy()
             return
-        try:
-            league_id = int(league_id_str)
-        except ValueError:
+        league_id = parse_int(league_id_str)
+        if league_id is None:
             messagebox.showerror("Error", "League ID must be a number.")
             root.destroy()
             return
@@ -4137,9 +4658,8 @@ def main():
                 messagebox.showerror("Error", "Starting team ID is required for batch mode.")
                 root.destroy()
                 return
-            try:
-                current_team_id = int(team_id_str)
-            except ValueError:
+            current_team_id = parse_int(team_id_str)
+            if current_team_id is None:
                 messagebox.showerror("Error", "Team ID must be a number.")
                 root.destroy()
                 return
@@ -4159,16 +4679,20 @@ def main():
                 root.destroy()
                 return
 
+            # Drop files picked more than once and order by file name, so each file gets
+            # exactly one team and the IDs come out the same for the same selection
+            player_files = sorted(dict.fromkeys(os.path.abspath(p) for p in player_files), key=os.path.basename)
+
             # Ask user to select a formation (same for all teams in batch mode)
             selected_formation = select_formation_dialog(root, formations)
             if not selected_formation:
                 # User cancelled or didn't select a formation
-                selected_formation = next((f for f in formations if f["name"] == "4-3-3"), None)
+                selected_formation = default_formation
                 print(f"No formation selected, defaulting to 4-3-3")
 
             # Process all teams
-            success_count = process_multiple_teams(player_files, current_team_id, league_id, input_dir,
-                                                   is_national_teams=False, selected_formation=selected_formation)
+            success_count = run_with_responsive_ui(root, process_multiple_teams, player_files, current_team_id,
+                                                   league_id, input_dir, selected_formation=selected_formation)
 
             # Show final results
             if success_count == len(player_files):
@@ -4192,76 +4716,38 @@ def main():
             total_success_count = 0
             created_team_ids = []
 
-            while continue_creating:
-                # Ask for team ID each time - just like for national teams
-                root.deiconify()
-                root.lift()
-                team_id_str = simpledialog.askstring("Club Team Creator",
-                                                     "Enter the team ID for this club team:",
-                                                     parent=root)
-                root.withdraw()
-                if not team_id_str:
-                    messagebox.showinfo("Cancelled", "No team ID entered. Exiting interactive mode.")
-                    break
+            # One appender for the whole session; reset() gives it each team's details
+            appender = TeamAppender(None, None, league_id)
 
-                try:
-                    current_team_id = int(team_id_str)
-                except ValueError:
-                    messagebox.showerror("Error", "Team ID must be a number.")
-                    continue  # Ask for team ID again
+            # (team_name, success, message) for every team, shown together once the session ends
+            results = []
 
-                # Ask for stadium ID (optional)
+            while continue_creating:
+                # Team ID, player file, formation and stadium are all entered in one form
                 root.deiconify()
                 root.lift()
-                stadium_id_str = simpledialog.askstring("Club Team Creator",
-                                                        "Enter the stadium ID for this team (or leave blank to skip):",
-                                                        parent=root)
+                config = team_config_dialog(root, "Club Team Creator", formations)
                 root.withdraw()
-                stadium_id = None
-                if stadium_id_str:
-                    try:
-                        stadium_id = int(stadium_id_str)
-                    except ValueError:
-                        messagebox.showwarning("Warning", "Invalid stadium ID. Stadium linking will be skipped.")
-
-                # Ask user to select the player file
-                messagebox.showinfo("Club Team Creator",
-                                    f"Please select the player CSV/TXT file for team ID: {current_team_id}")
+                if not config:
+                    if not results:
+                        messagebox.showinfo("Cancelled", "No team details entered. Exiting interactive mode.")
+                    break
 
-                player_file = filedialog.askopenfilename(
-                    title=f"Select Player CSV/TXT File for Team ID: {current_team_id}",
-                    filetypes=[("CSV/TXT files", "*.csv *.txt"), ("All files", "*.*")]
-                )
-
-                if not player_file:
-                    messagebox.showinfo("Cancelled", "No player file selected.")
-                    # Ask if they want to exit or try again
-                    if not messagebox.askyesno("Continue?", "Do you want to select a different file?"):
-                        break
-                    continue
+                current_team_id = config['team_id']
+                player_file = config['player_file']
+                selected_formation = config['formation']
+                stadium_id = config['stadium_id']
 
                 # Extract team name from the filename
-                team_name = os.path.basename(player_file)
-                if team_name.lower().endswith('.csv') or team_name.lower().endswith('.txt'):
-                    team_name = team_name[:-4]  # Remove extension
-
-                # Ask user to select a formation
-                root.deiconify()
-                root.lift()
-                selected_formation = select_formation_dialog(root, formations)
-                root.withdraw()
-                if not selected_formation:
-                    # User cancelled or didn't select a formation
-                    selected_formation = next((f for f in formations if f["name"] == "4-3-3"), None)
-                    print(f"No formation selected, defaulting to 4-3-3")
+                team_name = _team_name_from_path(player_file)
 
                 print(f"\nProcessing club team: {team_name} (ID: {current_team_id})")
                 print(f"Selected formation: {selected_formation['name']}")
                 if stadium_id:
                     print(f"Stadium ID: {stadium_id}")
 
-                # Create a team appender for this team
-                appender = TeamAppender(team_name, current_team_id, league_id, stadium_id=stadium_id)
+                # Point the session's appender at this team
+                appender.reset(team_name, current_team_id, league_id, stadium_id=stadium_id)
 
                 # Load player data and process files
                 success = False
@@ -4269,33 +4755,27 @@ def main():
                     if appender.process_files(input_dir, selected_formation):
                         success = True
                         total_success_count += 1
-                        created_team_ids.append(current_team_id)
+                        bisect.insort(created_team_ids, current_team_id)  # Kept sorted for display
 
-                # Show results
+                # Record the result and ask about the next team in the same prompt
                 if success:
-                    messagebox.showinfo("Success",
-                                        f"{team_name} club team created with ID {current_team_id} using {selected_formation['name']} formation!")
+                    result = f"{team_name} club team created with ID {current_team_id} using {selected_formation['name']} formation!"
                 else:
-                    messagebox.showwarning("Error",
-                                           f"Failed to create the {team_name} club team. Check the console for details.")
+                    result = f"Failed to create the {team_name} club team. Check the console for details."
+                results.append((team_name, success, result))
 
-                # Ask if user wants to create another team
-                continue_creating = messagebox.askyesno("Continue?", "Create another club team?")
+                continue_creating = messagebox.askyesno("Continue?", f"{result}\n\nCreate another club team?")
 
             # Show final results
-            if total_success_count > 0:
-                created_team_ids.sort()  # Sort IDs for better display
+            if results:
+                summary = f"Created {total_success_count} out of {len(results)} club teams."
                 if len(created_team_ids) > 10:
-                    # If many teams, just show the count and range
-                    messagebox.showinfo("Final Results",
-                                        f"Created {total_success_count} club teams successfully!\n" +
-                                        f"Team ID range: {min(created_team_ids)} - {max(created_team_ids)}")
-                else:
+                    # If many teams, just show the range
+                    summary += f"\nTeam ID range: {created_team_ids[0]} - {created_team_ids[-1]}"
+                elif created_team_ids:
                     # If few teams, show all the IDs
-                    id_text = ", ".join(str(tid) for tid in created_team_ids)
-                    messagebox.showinfo("Final Results",
-                                        f"Created {total_success_count} club teams successfully!\n" +
-                                        f"Team IDs: {id_text}")
+                    summary += f"\nTeam IDs: {', '.join(str(tid) for tid in created_team_ids)}"
+                show_team_results_dialog(root, "Final Results", summary, results)
 
         root.destroy()
         return
@@ -4303,92 +4783,66 @@ def main():
 
 
 # Also need to update process_multiple_teams function to accept formation parameter
-def process_multiple_teams(team_files, starting_team_id, league_id, input_dir, is_national_teams=False,
-                           players_txt_path=None, nation_id_map=None, selected_formation=None):
+def process_multiple_teams(team_files, starting_team_id, league_id, input_dir, selected_formation=None):
     """
-    Process multiple teams one after another
+    Process multiple club teams one after another
 
     Args:
-        team_files (list): List of paths to player CSV/TXT files (or nation names for national teams)
+        team_files (list): List of paths to player CSV/TXT files
         starting_team_id (int): ID to assign to the first team
-        league_id (int): League ID to use for all teams (78 for national teams)
+        league_id (int): League ID to use for all teams
         input_dir (str): Directory containing all game files
-        is_national_teams (bool): Whether these are national teams
-        players_txt_path (str): Path to players.txt file for national teams
-        nation_id_map (dict): Mapping of nation names to nation IDs
         selected_formation (dict): Formation data to use for all teams
 
     Returns:
         int: Number of teams successfully processed
     """
-    print(f"\nProcessing {len(team_files)} teams starting with ID: {starting_team_id}")
-
-    if is_national_teams:
-        print("Processing as NATIONAL TEAMS")
-        print(f"Using players.txt file: {players_txt_path}")
-        league_id = 78  # Always 78 for national teams
-
-    print(f"All teams will be assigned to league ID: {league_id}")
+    log.info("Processing %s teams starting with ID: %s", len(team_files), starting_team_id)
+    log.info("All teams will be assigned to league ID: %s", league_id)
     if selected_formation:
-        print(f"All teams will use formation: {selected_formation['name']}")
+        log.info("All teams will use formation: %s", selected_formation['name'])
 
     success_count = 0
     current_team_id = starting_team_id
 
-    for i, team_file_or_name in enumerate(team_files):
-        try:
-            if is_national_teams:
-                # For national teams, team_file_or_name is the nation name
-                team_name = team_file_or_name
-                nation_id = nation_id_map.get(team_name)
-
-                if not nation_id:
-                    print(f"✗ Could not find nation ID for {team_name}. Skipping.")
-                    continue
+    # Start from freshly scanned headers and IDs
+    clear_file_caches()
 
-                print(
-                    f"\nProcessing national team {i + 1}/{len(team_files)}: {team_name} (ID: {current_team_id}, Nation ID: {nation_id})")
+    # Player files are read and squads picked on a few threads, while the teams that are
+    # ready get written here in the original order. Writes stay on this thread because every
+    # team appends to the same game files and takes the next free IDs from them.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(MAX_LOADER_THREADS, len(team_files)))) as executor:
+        futures = [executor.submit(_load_batch_team, team_file, league_id) for team_file in team_files]
 
-                # Create a team appender for this national team
-                appender = TeamAppender(team_name, current_team_id, league_id, nation_id, is_national_team=True)
+        team_count = len(team_files)
+        # Only format the per-team progress lines, and print tracebacks, when debug output is on
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
 
-                # Load player data from players.txt
-                if not appender.load_player_data(players_txt_path):
-                    print(f"✗ Failed to load player data for {team_name}. Skipping.")
+        for i, (team_file, future) in enumerate(zip(team_files, futures)):
+            try:
+                team_name, appender, error = future.result()
+                if error:
+                    log.error(error)
                     continue
-            else:
-                # Regular club team processing
-                team_file = team_file_or_name
 
-                # Extract team name from the filename
-                team_name = os.path.basename(team_file)
-                if team_name.lower().endswith('.csv') or team_name.lower().endswith('.txt'):
-                    team_name = team_name[:-4]  # Remove extension
-
-                print(f"\nProcessing team {i + 1}/{len(team_files)}: {team_name} (ID: {current_team_id})")
-
-                # Create a team appender for this team
-                appender = TeamAppender(team_name, current_team_id, league_id)
-
-                # Load player data
-                if not appender.load_player_data(team_file):
-                    print(f"✗ Failed to load player data for {team_name}. Skipping.")
-                    continue
+                appender.team_id = current_team_id
+                if debug_enabled:
+                    log.debug("Processing team %d/%d: %s (ID: %s)", i + 1, team_count, team_name, current_team_id)
 
-            # Process all files
-            if appender.process_files(input_dir, selected_formation):
-                success_count += 1
-                print(f"✓ Team {team_name} processed successfully.")
-            else:
-                print(f"✗ Some errors occurred while processing team {team_name}.")
+                # Process all files
+                if appender.process_files(input_dir, selected_formation):
+                    success_count += 1
+                    log.info("✓ Team %s processed successfully.", team_name)
+                else:
+                    log.error("✗ Some errors occurred while processing team %s.", team_name)
 
-            # Increment team ID for the next team
-            current_team_id += 1
-        except Exception as e:
-            print(f"✗ Error processing team {team_file_or_name}: {str(e)}")
-            traceback.print_exc()
-            continue
+                # Increment team ID for the next team
+                current_team_id += 1
+            except Exception as e:
+                log.error("✗ Error processing team %s: %s", team_file, e, exc_info=debug_enabled)
+                continue
 
+    clear_file_caches()
     return success_count
 
 